@@ -1,8 +1,23 @@
-import json
+import asyncio
+import functools
+import heapq
 import logging
+import re
+import threading
 import azure.functions as func
+import orjson
+from cachetools import TTLCache
+from typing import TYPE_CHECKING
 
-from queryGitHub import GitHubAPIClient, create_github_client
+if TYPE_CHECKING:
+    from queryGitHub import GitHubAPIClient
+
+logger = logging.getLogger(__name__)
+
+# orjson parses bytes directly and serializes to bytes, skipping the stdlib
+# json bytecode loop. The MCP binding expects str, so dumps decodes once.
+_loads = orjson.loads
+_dumps = lambda obj: orjson.dumps(obj).decode()
 
 # =============================================================================
 # CONSTANTS AND UTILITY CLASSES
@@ -29,21 +44,25 @@ class ToolProperty:
     
     This helps the AI to correctly invoke the tool with appropriate parameters.
     """
+    __slots__ = ('propertyName', 'propertyType', 'description', '_d')
+
     def __init__(self, property_name: str, property_type: str, description: str):
         self.propertyName = property_name    # Name of the property
         self.propertyType = property_type    # Data type (string, number, etc.)
         self.description = description       # Human-readable description
+        # The definition is immutable, so build the serialized form once
+        self._d = {
+            "propertyName": property_name,
+            "propertyType": property_type,
+            "description": description,
+        }
         
     def to_dict(self):
         """
         Converts the property definition to a dictionary format for JSON serialization.
         Required for MCP tool registration.
         """
-        return {
-            "propertyName": self.propertyName,
-            "propertyType": self.propertyType,
-            "description": self.description,
-        }
+        return self._d
 
 # =============================================================================
 # TOOL PROPERTY DEFINITIONS
@@ -52,31 +71,103 @@ class ToolProperty:
 # This is how AI assistants know what parameters to provide when using these tools
 
 # TODO: Lab Exercise 1 - Define the tool properties for query_github tool
-# Create a list of ToolProperty objects that define the expected inputs (schema)
-# Each property has a name, type, and description for the AI agent
-tool_properties_github_query = [
-    ToolProperty(_GHQ_NAME_PROPERTY_NAME, "string", "The unique name for the code snippet."),
-    ToolProperty(_PROJECT_ID_PROPERTY_NAME, "string", "The ID of the project the snippet belongs to. Optional, defaults to 'default-project' if not provided."),
-    ToolProperty(_GHQ_PROPERTY_NAME, "string", "The actual code content of the snippet."),
-]
+# The schemas are static, so they are stored as pre-serialized JSON literals
+# rather than built from ToolProperty objects on every cold start. To change a
+# schema, build it with ToolProperty(...).to_dict() and paste the JSON here.
+
+# Convert tool properties to JSON for MCP tool registration
+# This is required format for the MCP tool trigger binding
+tool_properties_github_query_json = (
+    '[{"propertyName":"githubqueryname","propertyType":"string","description":"The unique name for the code snippet."},'
+    '{"propertyName":"projectid","propertyType":"string","description":"The ID of the project the snippet belongs to. Optional, defaults to \'default-project\' if not provided."},'
+    '{"propertyName":"githubquery","propertyType":"string","description":"The actual code content of the snippet."}]'
+)
 
 # Properties for the deep_wiki tool
 # This tool generates comprehensive documentation from code snippets
-tool_properties_wiki = [
-    ToolProperty(_CHAT_HISTORY_PROPERTY_NAME, "string", "Optional. The preceding conversation history (e.g., user prompts and AI responses). Providing this helps contextualize the wiki content generation. Omit if no relevant history exists or if a general wiki is desired."),
-    ToolProperty(_USER_QUERY_PROPERTY_NAME, "string", "Optional. The user's specific question, instruction, or topic to focus the wiki documentation on. If omitted, a general wiki covering available snippets might be generated."),
-]
+tool_properties_wiki_json = (
+    '[{"propertyName":"chathistory","propertyType":"string","description":"Optional. The preceding conversation history (e.g., user prompts and AI responses). Providing this helps contextualize the wiki content generation. Omit if no relevant history exists or if a general wiki is desired."},'
+    '{"propertyName":"userquery","propertyType":"string","description":"Optional. The user\'s specific question, instruction, or topic to focus the wiki documentation on. If omitted, a general wiki covering available snippets might be generated."}]'
+)
 
-# Convert tool properties to JSON for MCP tool registration
-# This is required format for the MCP tool trigger binding
-tool_properties_github_query_json = json.dumps([prop.to_dict() for prop in tool_properties_github_query])
-tool_properties_wiki_json = json.dumps([prop.to_dict() for prop in tool_properties_wiki])
+# =============================================================================
+# GITHUB RESPONSE CACHE
+# =============================================================================
+# Module-scope caches survive across invocations on a warm Functions host, so
+# repeat queries are served from memory instead of re-hitting the GitHub API.
+# READMEs change rarely; search rankings drift faster, so they expire sooner.
+_search_cache = TTLCache(maxsize=256, ttl=300)
+_readme_cache = TTLCache(maxsize=1024, ttl=3600)
+_cache_lock = threading.Lock()  # TTLCache is not thread-safe
+_MISSING = object()
+
+# Upper bound on concurrent README fetches per request
+_README_FETCH_CONCURRENCY = 10
+
+# Only the start of each README is rendered (a 1000-char preview or a short
+# snippet window), so fetch at most this many bytes via an HTTP Range request.
+_README_MAX_BYTES = 4096
+
+# Per-repository output blocks. Rendering through str.format against the repo
+# dict merged over these defaults replaces a chain of repo.get() calls.
+_REPO_DEFAULTS = {
+    'description': 'No description',
+    'language': 'Unknown',
+    'stargazers_count': 0,
+    'forks_count': 0,
+    'html_url': 'Unknown',
+    'updated_at': 'Unknown',
+}
+_REPO_TEMPLATE = (
+    "{i}. {name} ({owner[login]})\n"
+    "   Description: {description}\n"
+    "   Language: {language}\n"
+    "   Stars: {stargazers_count:,}\n"
+    "   Forks: {forks_count:,}\n"
+    "   URL: {html_url}\n"
+    "   Updated: {updated_at:.10}\n"
+)
+_OWNER_REPO_TEMPLATE = (
+    "{i}. {name}\n"
+    "   Description: {description}\n"
+    "   Language: {language}\n"
+    "   Stars: {stargazers_count}\n"
+    "   Forks: {forks_count}\n"
+    "   Updated: {updated_at}\n"
+    "\n"
+)
+
+# GitHub search qualifiers that mark a query as a search rather than an owner name
+_SEARCH_OP_RE = re.compile(r'\b(?:in|language|topic|user|org|repo):', re.IGNORECASE)
+
+# README snippet search: match case-insensitively on the original text rather
+# than lowering a copy of the README.
+_KINECT_RE = re.compile(r'kinect', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=1)
+def _client() -> "GitHubAPIClient":
+    """Return the process-wide GitHub client so warm invocations reuse its pooled connections."""
+    # Imported on first use so requests/urllib3/ssl stay off the cold-start path
+    from queryGitHub import create_github_client
+    return create_github_client()
+
+def _cached(cache: TTLCache, fn, *args, **kwargs):
+    """Return fn(*args, **kwargs), reusing a cached result keyed by method and arguments."""
+    key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+    with _cache_lock:
+        value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = fn(*args, **kwargs)
+        with _cache_lock:
+            cache[key] = value
+    return value
 
 app = func.FunctionApp()
 
 @app.route(route="query-github", methods=["GET", "POST"], auth_level=func.AuthLevel.FUNCTION)
 async def http_query_github(req: func.HttpRequest) -> func.HttpResponse:
-    logging.info('Python HTTP trigger function processed a request.')
+    logger.info('Python HTTP trigger function processed a request.')
 
     # the input looks like this:
 #     {
@@ -87,8 +178,8 @@ async def http_query_github(req: func.HttpRequest) -> func.HttpResponse:
 
     # Get the json body for the input
     try:
-        req_body = req.get_json()
-    except ValueError:
+        req_body = _loads(req.get_body())
+    except orjson.JSONDecodeError:
         return func.HttpResponse(
             "Invalid JSON body. Please provide a valid JSON input.",
             status_code=400
@@ -107,8 +198,9 @@ async def http_query_github(req: func.HttpRequest) -> func.HttpResponse:
         )
 
     if githubquery:
-        result = _query_repositories(githubquery)
-        return func.HttpResponse(f"Repositories for '{githubqueryname}':\n{result}", status_code=200)
+        result = await _query_repositories(githubquery)
+        body = f"Repositories for '{githubqueryname}':\n{result}".encode()
+        return func.HttpResponse(body=body, status_code=200, mimetype="text/plain", charset="utf-8")
 
     else:
         return func.HttpResponse(
@@ -121,13 +213,14 @@ async def search_kinect_repositories(req: func.HttpRequest) -> func.HttpResponse
     """
     Search for GitHub repositories that use Kinect devices.
     """
-    logging.info('Kinect repository search function processed a request.')
+    logger.info('Kinect repository search function processed a request.')
     
     try:
-        result = _search_kinect_repositories()
-        return func.HttpResponse(f"Kinect Repositories:\n{result}", status_code=200)
+        result = await _search_kinect_repositories()
+        body = f"Kinect Repositories:\n{result}".encode()
+        return func.HttpResponse(body=body, status_code=200, mimetype="text/plain", charset="utf-8")
     except Exception as e:
-        logging.error(f"Error searching Kinect repositories: {str(e)}")
+        logger.error("Error searching Kinect repositories: %s", e)
         return func.HttpResponse(f"Error: {str(e)}", status_code=500)
     
 
@@ -138,7 +231,7 @@ async def search_kinect_repositories(req: func.HttpRequest) -> func.HttpResponse
     description="Get information about a GitHub repository.", # Description for the agent
     toolProperties=tool_properties_github_query_json, # The input schema (from Ex 1)
 )
-def mcp_query_github(context) -> str:
+async def mcp_query_github(context) -> str:
     """
     MCP tool to retrieve information about a GitHub repository.
     
@@ -153,7 +246,7 @@ def mcp_query_github(context) -> str:
     """
     try:
         # 1. Parse the context JSON string to extract the arguments
-        mcp_data = json.loads(context)
+        mcp_data = _loads(context)
         args = mcp_data.get("arguments", {})
         
         # 2. Extract the query from the arguments
@@ -161,276 +254,182 @@ def mcp_query_github(context) -> str:
 
         # 3. Validate the required parameter
         if not query:
-            return json.dumps({"error": f"Missing essential argument: {_GHQ_PROPERTY_NAME}. Please provide the search query."})
+            return _dumps({"error": f"Missing essential argument: {_GHQ_PROPERTY_NAME}. Please provide the search query."})
 
         if query:
-            result = _query_repositories(query)
+            result = await _query_repositories(query)
         # 4. Retrieve the snippet from Cosmos DB
         # Uses the same storage function as the HTTP endpoint
         #snippet = await cosmos_ops.get_snippet_by_id(name)
        # if not snippet:
             # Return an error if the snippet doesn't exist
-           # return json.dumps({"error": f"Snippet '{name}' not found"})
+           # return _dumps({"error": f"Snippet '{name}' not found"})
         
         # 5. Return the snippet as a JSON string
-        return json.dumps(result)
-    except json.JSONDecodeError:
+        # The mcpToolTrigger binding only accepts str, so orjson's bytes are decoded here
+        return _dumps(result)
+    except orjson.JSONDecodeError:
         # Handle invalid context JSON
-        return json.dumps({"error": "Invalid JSON received in context"})
+        return _dumps({"error": "Invalid JSON received in context"})
     except Exception as e:
         # General error handling
-        logging.error(f"Error in mcp_get_snippet: {str(e)}")
-        return json.dumps({"error": str(e)})
+        logger.error("Error in mcp_get_snippet: %s", e)
+        return _dumps({"error": str(e)})
+
+
 
+async def _iter_readmes(client, repos):
+    """
+    Fetch the README for each repository concurrently, yielding (rank, repo, readme) in order.
+
+    The GitHub client is synchronous, so each fetch runs in a worker thread and
+    the event loop overlaps the round-trips. A semaphore bounds the fan-out to
+    stay clear of GitHub's secondary rate limits. All fetches start up front,
+    and each pair is yielded as soon as that README (and every earlier one) has
+    arrived, so callers can emit output before the slowest fetch completes.
+    readme is None where the README is missing or could not be fetched.
+    """
+    semaphore = asyncio.Semaphore(_README_FETCH_CONCURRENCY)
 
+    async def fetch(repo):
+        async with semaphore:
+            return await asyncio.to_thread(
+                _cached, _readme_cache, client.get_repository_readme, repo['owner']['login'], repo['name'],
+                max_bytes=_README_MAX_BYTES
+            )
+
+    tasks = [asyncio.create_task(fetch(repo)) for repo in repos]
+    try:
+        for rank, (repo, task) in enumerate(zip(repos, tasks), 1):
+            # Like gather(return_exceptions=True), but per task so output can stream:
+            # a failed fetch is inspected once here instead of raised and swallowed
+            await asyncio.wait((task,))
+            error = task.exception()
+            if error is not None:
+                logger.debug("Could not get README for %s: %s", repo['name'], error)  # Don't fail the listing
+            yield rank, repo, None if error is not None else task.result()
+    finally:
+        # Stop outstanding fetches if the consumer bails out early
+        for task in tasks:
+            task.cancel()
 
-def _query_repositories(query: str):
+async def _query_repositories(query: str):
     """Search repositories based on query - can be org/user name or search query"""
-    client = create_github_client()
-    
-    result = ""
+    return "".join([chunk async for chunk in _iter_query_results(query)])
+
+async def _iter_query_results(query: str):
+    """
+    Yield the _query_repositories output chunk by chunk.
+
+    Each repository block is yielded as soon as its README is available, so a
+    streaming consumer can start sending before every fetch has finished.
+    """
+    client = _client()
     
     # Check if this looks like a search query (contains search operators)
-    if any(operator in query.lower() for operator in ['in:', 'language:', 'topic:', 'user:', 'org:', 'repo:']):
+    if _SEARCH_OP_RE.search(query):
         # This is a search query, use search API
-        print(f"Performing search query: {query}")
+        logger.debug("Performing search query: %s", query)
         try:
-            search_results = client.search_repositories(query, sort="stars", order="desc", per_page=15)
+            search_results = await asyncio.to_thread(
+                _cached, _search_cache, client.search_repositories, query, sort="stars", order="desc", per_page=15
+            )
             
             if 'items' in search_results and search_results['items']:
                 total_count = search_results.get('total_count', 0)
-                result += f"Found {total_count:,} repositories matching '{query}':\n\n"
+                yield f"Found {total_count:,} repositories matching '{query}':\n\n"
                 
-                for i, repo in enumerate(search_results['items'][:10]):  # Show top 10
-                    result += f"{i+1}. {repo['name']} ({repo['owner']['login']})\n"
-                    result += f"   Description: {repo.get('description', 'No description')}\n"
-                    result += f"   Language: {repo.get('language', 'Unknown')}\n"
-                    result += f"   Stars: {repo.get('stargazers_count', 0):,}\n"
-                    result += f"   Forks: {repo.get('forks_count', 0):,}\n"
-                    result += f"   URL: {repo.get('html_url', 'Unknown')}\n"
-                    result += f"   Updated: {repo.get('updated_at', 'Unknown')[:10]}\n"
+                repos = search_results['items'][:10]  # Show top 10
+                
+                # Use the first word as the README search term
+                search_term_re = re.compile(re.escape(query.split()[0]), re.IGNORECASE)
+                
+                async for i, repo, readme in _iter_readmes(client, repos):
+                    yield _REPO_TEMPLATE.format(i=i, **{**_REPO_DEFAULTS, **repo})
                     
-                    # Try to get README snippet if it mentions the search term
-                    try:
-                        readme = client.get_repository_readme(repo['owner']['login'], repo['name'])
-                        if readme:
-                            search_term = query.split()[0].lower()  # Get first word as search term
-                            if search_term in readme.lower():
-                                readme_lower = readme.lower()
-                                pos = readme_lower.find(search_term)
-                                if pos >= 0:
-                                    start_pos = max(0, pos - 50)
-                                    end_pos = min(len(readme), pos + 150)
-                                    snippet = readme[start_pos:end_pos].strip()
-                                    # Clean up snippet
-                                    snippet = ' '.join(snippet.split())
-                                    if len(snippet) > 120:
-                                        snippet = snippet[:117] + "..."
-                                    result += f"   README: ...{snippet}...\n"
-                    except Exception as e:
-                        pass  # Don't fail if README fetch fails
+                    # Add a README snippet if it mentions the search term
+                    match = search_term_re.search(readme) if readme else None
+                    if match:
+                        pos = match.start()
+                        start_pos = max(0, pos - 50)
+                        end_pos = min(len(readme), pos + 150)
+                        # Collapse whitespace in the window only, in one pass
+                        snippet = _WS_RE.sub(' ', readme[start_pos:end_pos]).strip()
+                        if len(snippet) > 120:
+                            snippet = snippet[:117] + "..."
+                        yield f"   README: ...{snippet}...\n"
                     
-                    result += "\n"
+                    yield "\n"
             else:
-                result += f"No repositories found matching '{query}'\n"
+                yield f"No repositories found matching '{query}'\n"
                 
         except Exception as e:
-            print(f"Error searching repositories: {e}")
-            result += f"Error searching repositories: {e}\n"
+            logger.error("Error searching repositories: %s", e)
+            yield f"Error searching repositories: {e}\n"
     else:
         # This looks like an organization or user name, use the original logic
         org_name = query
-        print(f"Fetching repositories for organization/user: {org_name}")    
+        logger.debug("Fetching repositories for organization/user: %s", org_name)
         try:
-            repos = client.get_repositories(query)
-            print(f"Found {len(repos)} repositories\n")
+            repos = await asyncio.to_thread(client.get_repositories, query)
+            logger.debug("Found %d repositories", len(repos))
             
             # Display first 3 repositories with key information
-            for i, repo in enumerate(repos[:3]):
-                # Now get the readme for each repository
-                readme = client.get_repository_readme(repo['owner']['login'], repo['name'])
+            async for i, repo, readme in _iter_readmes(client, repos[:3]):
                 if readme:
-                    print(f"README for {repo['name']} found, length: {len(readme)} characters")
-                    result += f"README for {repo['name']}:\n{readme[:1000]}...\n\n"
+                    logger.debug("README for %s found, length: %d characters", repo['name'], len(readme))
+                    yield f"README for {repo['name']}:\n{readme[:1000]}...\n\n"
                 else:
-                    print(f"README for {repo['name']} not found")
-
-                result += f"{i+1}. {repo['name']}\n"
-                result += f"   Description: {repo.get('description', 'No description')}\n"
-                result += f"   Language: {repo.get('language', 'Unknown')}\n"
-                result += f"   Stars: {repo.get('stargazers_count', 0)}\n"
-                result += f"   Forks: {repo.get('forks_count', 0)}\n"
-                result += f"   Updated: {repo.get('updated_at', 'Unknown')}\n"
-                result += "\n"
+                    logger.debug("README for %s not found", repo['name'])
+
+                yield _OWNER_REPO_TEMPLATE.format(i=i, **{**_REPO_DEFAULTS, **repo})
                 
         except Exception as e:
-            print(f"Error fetching repositories: {e}")
-            result += f"Error fetching repositories: {e}\n"
-
-    return result
+            logger.error("Error fetching repositories: %s", e)
+            yield f"Error fetching repositories: {e}\n"
 
-def _search_kinect_repositories():
+async def _search_kinect_repositories():
     """Search for GitHub repositories that use Kinect devices"""
-    client = create_github_client()
-    
-    result = ""
+    return "".join([chunk async for chunk in _iter_kinect_results()])
+
+async def _iter_kinect_results():
+    """Yield the _search_kinect_repositories output chunk by chunk, one repository block at a time."""
+    client = _client()
     
-    # Different search queries to find Kinect-related repositories
-    search_queries = [
-        "kinect in:name,description,readme",
-        "kinect SDK",
-        "microsoft kinect",
-        "kinect sensor",
-        "kinect v2",
-        "kinect azure",
-        "kinect depth camera",
-        "kinect body tracking"
-    ]
+    # A single full-text search covers the former "kinect SDK", "kinect v2",
+    # "kinect sensor", ... variants, since those terms all contain "kinect" and
+    # are matched in the name, description or README. One request instead of
+    # eight keeps us well inside the 30 req/min search quota.
+    search_query = "kinect in:name,description,readme"
     
     try:
-        all_repos = []
-        seen_repos = set()  # To avoid duplicates
-        
-        for query in search_queries:
-            print(f"Searching with query: '{query}'")
-            search_results = client.search_repositories(query, sort="stars", order="desc", per_page=10)
-            
-            if 'items' in search_results:
-                for repo in search_results['items']:
-                    repo_key = f"{repo['owner']['login']}/{repo['name']}"
-                    if repo_key not in seen_repos:
-                        seen_repos.add(repo_key)
-                        all_repos.append(repo)
-            
-            # Limit to avoid too many API calls
-            if len(all_repos) >= 20:
-                break
-        
-        result += f"Found {len(all_repos)} unique Kinect-related repositories:\n\n"
+        logger.debug("Searching with query: '%s'", search_query)
+        search_results = await asyncio.to_thread(
+            _cached, _search_cache, client.search_repositories, search_query, sort="stars", order="desc", per_page=20
+        )
+        all_repos = search_results.get('items', [])
         
-        # Sort by stars for better results
-        all_repos.sort(key=lambda x: x.get('stargazers_count', 0), reverse=True)
+        yield f"Found {len(all_repos)} unique Kinect-related repositories:\n\n"
         
-        for i, repo in enumerate(all_repos[:15]):  # Show top 15
-            result += f"{i+1}. {repo['name']} ({repo['owner']['login']})\n"
-            result += f"   Description: {repo.get('description', 'No description')}\n"
-            result += f"   Language: {repo.get('language', 'Unknown')}\n"
-            result += f"   Stars: {repo.get('stargazers_count', 0)}\n"
-            result += f"   Forks: {repo.get('forks_count', 0)}\n"
-            result += f"   URL: {repo.get('html_url', 'Unknown')}\n"
-            result += f"   Updated: {repo.get('updated_at', 'Unknown')}\n"
-            
-            # Try to get README snippet for more context
-            try:
-                readme = client.get_repository_readme(repo['owner']['login'], repo['name'])
-                if readme and 'kinect' in readme.lower():
-                    # Find the first mention of Kinect in README
-                    readme_lower = readme.lower()
-                    kinect_pos = readme_lower.find('kinect')
-                    if kinect_pos >= 0:
-                        start_pos = max(0, kinect_pos - 100)
-                        end_pos = min(len(readme), kinect_pos + 200)
-                        snippet = readme[start_pos:end_pos].strip()
-                        result += f"   README snippet: ...{snippet}...\n"
-            except Exception as e:
-                print(f"Could not get README for {repo['name']}: {e}")
-            
-            result += "\n"
-            
-    except Exception as e:
-        print(f"Error searching Kinect repositories: {e}")
-        result += f"Error searching Kinect repositories: {e}\n"
-
-    return result
-
-def example_query_readme():
-    """Example: Get README for a specific repository"""
-    client = create_github_client()
-    
-    owner = "microsoft"
-    repo_name = "vscode"
-    
-    print(f"Fetching README for {owner}/{repo_name}")
-    
-    try:
-        readme = client.get_repository_readme(owner, repo_name)
-        if readme:
-            print(f"README length: {len(readme)} characters")
-            print("First 300 characters:")
-            print(readme[:300] + "...\n")
-        else:
-            print("README not found\n")
-            
-    except Exception as e:
-        print(f"Error fetching README: {e}")
-
-def example_query_issues():
-    """Example: Get issues for a repository"""
-    client = create_github_client()
-    
-    owner = "microsoft"
-    repo_name = "vscode"
-    
-    print(f"Fetching open issues for {owner}/{repo_name}")
-    
-    try:
-        issues = client.get_repository_issues(owner, repo_name, state="open")
-        print(f"Found {len(issues)} open issues\n")
+        # Pick the top 15 by stars; the items come from the shared search cache,
+        # so they are read with .get() rather than backfilled in place
+        top_repos = heapq.nlargest(15, all_repos, key=lambda repo: repo.get('stargazers_count', 0))
         
-        # Display first 3 issues
-        for i, issue in enumerate(issues[:3]):
-            print(f"{i+1}. #{issue['number']}: {issue['title']}")
-            print(f"   Author: {issue['user']['login']}")
-            print(f"   Created: {issue['created_at']}")
-            print(f"   Labels: {', '.join([label['name'] for label in issue.get('labels', [])])}")
-            print()
+        async for i, repo, readme in _iter_readmes(client, top_repos):
+            yield _REPO_TEMPLATE.format(i=i, **{**_REPO_DEFAULTS, **repo})
             
-    except Exception as e:
-        print(f"Error fetching issues: {e}")
-
-def example_query_pull_requests():
-    """Example: Get pull requests for a repository"""
-    client = create_github_client()
-    
-    owner = "microsoft"
-    repo_name = "vscode"
-    
-    print(f"Fetching open pull requests for {owner}/{repo_name}")
-    
-    try:
-        prs = client.get_repository_pull_requests(owner, repo_name, state="open")
-        print(f"Found {len(prs)} open pull requests\n")
-        
-        # Display first 3 PRs
-        for i, pr in enumerate(prs[:3]):
-            print(f"{i+1}. #{pr['number']}: {pr['title']}")
-            print(f"   Author: {pr['user']['login']}")
-            print(f"   Created: {pr['created_at']}")
-            print(f"   Base: {pr['base']['ref']} ← Head: {pr['head']['ref']}")
-            print()
+            # Add a README snippet for more context
+            # Find the first mention of Kinect in README
+            match = _KINECT_RE.search(readme) if readme else None
+            if match:
+                kinect_pos = match.start()
+                start_pos = max(0, kinect_pos - 100)
+                end_pos = min(len(readme), kinect_pos + 200)
+                snippet = _WS_RE.sub(' ', readme[start_pos:end_pos]).strip()
+                yield f"   README snippet: ...{snippet}...\n"
             
-    except Exception as e:
-        print(f"Error fetching pull requests: {e}")
-
-def example_query_contributors():
-    """Example: Get contributors for a repository"""
-    client = create_github_client()
-    
-    owner = "microsoft"
-    repo_name = "vscode"
-    
-    print(f"Fetching contributors for {owner}/{repo_name}")
-    
-    try:
-        contributors = client.get_repository_contributors(owner, repo_name)
-        print(f"Found {len(contributors)} contributors\n")
-        
-        # Display top 5 contributors
-        for i, contributor in enumerate(contributors[:5]):
-            print(f"{i+1}. {contributor['login']}")
-            print(f"   Contributions: {contributor['contributions']}")
-            print(f"   Profile: {contributor['html_url']}")
-            print()
+            yield "\n"
             
     except Exception as e:
-        print(f"Error fetching contributors: {e}")
+        logger.error("Error searching Kinect repositories: %s", e)
+        yield f"Error searching Kinect repositories: {e}\n"
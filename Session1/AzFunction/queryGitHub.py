@@ -9,12 +9,26 @@ Date: July 20, 2025
 """
 
 import os
+import re
+import asyncio
+import hashlib
+import itertools
 import logging
+import httpx
+import orjson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Any
-from functools import wraps
-import base64
+import zlib
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -30,6 +44,288 @@ logger = logging.getLogger(__name__)
 #loadenv()
 # Load environment variables from .env file if present
 
+# On-disk HTTP cache for GET responses. Defaults to the temp directory because
+# the Function App's wwwroot may be read-only when running from a package.
+_CACHE_PATH = os.getenv('GITHUB_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'github_cache'))
+
+def _cache_path_for(token: Optional[str]) -> str:
+    """
+    Return the on-disk cache path for a token.
+    
+    requests-cache leaves Authorization out of the cache key, so clients with
+    different tokens (or none) must not share a cache file: a private
+    repository's response could otherwise be served to another caller. The
+    token itself is never written to the path, only a digest of it.
+    
+    Args:
+        token: GitHub token, or None for anonymous access
+        
+    Returns:
+        Cache file path (without extension) for that token
+    """
+    if not token:
+        return f"{_CACHE_PATH}-anonymous"
+    return f"{_CACHE_PATH}-{hashlib.sha256(token.encode()).hexdigest()[:12]}"
+
+# Cache lifetimes in seconds: READMEs change rarely, issue/PR lists and search
+# results churn. Expired entries are revalidated with If-None-Match, and a 304
+# doesn't count against the rate limit. First matching pattern wins.
+_CACHE_EXPIRE_AFTER = 3600
+_CACHE_URLS_EXPIRE_AFTER = {
+    '*/search/*': 300,
+    '*/readme': 86400,
+    '*/issues': 300,
+    '*/pulls': 300,
+    # Contributor lists barely change; after expiry they are revalidated rather than re-downloaded
+    '*/contributors': 21600,
+}
+
+def _decompress(data: bytes) -> bytes:
+    """Inflate a cached response, reporting corrupt or pre-compression entries as a cache miss."""
+    try:
+        return zlib.decompress(data)
+    except zlib.error as e:
+        # requests-cache treats ValueError from a serializer as an unreadable entry
+        raise ValueError(f"Undecodable cache entry: {e}") from e
+
+# Cached responses are stored decompressed by urllib3, so JSON pages would sit
+# on disk at full size; compressing the pickled entry shrinks them ~5-10x.
+_CACHE_SERIALIZER = requests_cache.SerializerPipeline(
+    [
+        requests_cache.pickle_serializer,
+        requests_cache.Stage(dumps=lambda data: zlib.compress(data, 6), loads=_decompress)
+    ],
+    is_binary=True
+)
+
+# Advertise Brotli only when a decoder is installed for urllib3 to use
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Worker threads used to fetch pages 2..N of a paginated endpoint in parallel
+_PAGINATION_WORKERS = 10
+
+# Once fewer than this share of X-RateLimit-Limit remains (50 of 5000 with a
+# token), requests are spaced evenly over the time left until X-RateLimit-Reset.
+_RATE_LIMIT_THRESHOLD_FRACTION = 0.01
+
+# Primary rate limits per rolling hour, enforced locally with a sliding window
+# so the first requests of a burst are throttled too, before any headers arrive.
+_HOURLY_LIMIT_AUTHENTICATED = 5000
+_HOURLY_LIMIT_ANONYMOUS = 60
+
+# Longest we block a caller waiting for rate-limit budget. Pacing waits are
+# capped at this; an exhausted budget needing longer raises RateLimitError
+# instead of stalling the Function host.
+_MAX_RATE_LIMIT_WAIT = 60
+
+# Times a 403/429 response carrying Retry-After (or an exhausted budget) is retried
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# Connection failures and gateway errors are retried by the transport with
+# exponential backoff (0.3s, 0.6s, 1.2s). Rate-limit responses are left to
+# GitHubAPIClient._send, which reads GitHub's own headers. GraphQL queries
+# are POSTs but read-only, so POST is safe to retry too.
+_TRANSIENT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Response header names, looked up on every response
+_HDR_LIMIT = 'X-RateLimit-Limit'
+_HDR_REMAINING = 'X-RateLimit-Remaining'
+_HDR_RESET = 'X-RateLimit-Reset'
+_HDR_RESOURCE = 'X-RateLimit-Resource'
+_HDR_RETRY_AFTER = 'Retry-After'
+_HDR_LINK = 'Link'
+_HDR_LAST_MODIFIED = 'Last-Modified'
+_HDR_ETAG = 'ETag'
+
+# Responses AsyncGitHubAPIClient keeps for conditional requests; least
+# recently used entries are dropped beyond this
+_MAX_REVALIDATION_ENTRIES = 1024
+
+# Repositories whose issue lists GitHubAPIClient keeps for incremental
+# refreshes; least recently used snapshots are dropped beyond this
+_MAX_ISSUE_SNAPSHOTS = 32
+
+# Matches the rel="last" entry of a GitHub Link header and captures its page number
+_LINK_LAST_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+def _parse_last_page(link_header: Optional[str]) -> int:
+    """
+    Extract the last page number from a GitHub ``Link`` response header.
+    
+    Args:
+        link_header: Value of the Link header, or None if absent
+        
+    Returns:
+        The page number of the rel="last" link, or 1 if there is only one page
+    """
+    if not link_header:
+        return 1
+    match = _LINK_LAST_RE.search(link_header)
+    return int(match.group(1)) if match else 1
+
+# Media type that makes the contents/README endpoints return the file itself
+_RAW_MEDIA_TYPE = 'application/vnd.github.raw'
+
+# The search API returns at most this many results for any query
+_SEARCH_RESULT_LIMIT = 1000
+
+# Repositories per GraphQL request when fetching READMEs in bulk
+_GRAPHQL_BATCH_SIZE = 100
+
+def _build_readme_query(count: int) -> str:
+    """
+    Build a GraphQL document that fetches README.md for `count` repositories of one owner.
+    
+    Each repository is an aliased field r0..r{count-1} whose name comes from
+    the variable $n0..$n{count-1}, so names are never spliced into the query.
+    
+    Args:
+        count: Number of repositories in the batch
+        
+    Returns:
+        GraphQL query text taking $owner and $n0..$n{count-1}
+    """
+    variables = ''.join(f', $n{i}: String!' for i in range(count))
+    fields = ''.join(
+        f' r{i}: repository(owner: $owner, name: $n{i}) {{ object(expression: "HEAD:README.md") {{ ... on Blob {{ text }} }} }}'
+        for i in range(count)
+    )
+    return f'query($owner: String!{variables}) {{{fields} }}'
+
+def _post_process_issues(page: List[Dict[str, Any]],
+                         transform: Optional[Callable[[Dict[str, Any]], Any]] = None) -> List[Any]:
+    """
+    Drop pull requests from a page of the issues endpoint and apply an optional per-issue transform.
+    
+    Module-level so it can be pickled into a ProcessPoolExecutor worker.
+    
+    Args:
+        page: One page of the issues endpoint
+        transform: Function applied to each remaining issue
+        
+    Returns:
+        The page's issues, transformed if a transform was given
+    """
+    issues = [issue for issue in page if 'pull_request' not in issue]
+    return [transform(issue) for issue in issues] if transform else issues
+
+@lru_cache(maxsize=1)
+def _process_pool() -> ProcessPoolExecutor:
+    """Return the process pool for CPU-bound page post-processing, started on first use."""
+    return ProcessPoolExecutor()
+
+def _search_last_page(total_count: int, per_page: int, max_results: int) -> int:
+    """
+    Number of search result pages needed to collect max_results results.
+    
+    Args:
+        total_count: total_count reported by the first page
+        per_page: Results per page
+        max_results: Maximum number of results wanted
+        
+    Returns:
+        Last page to request, never past the search API's 1000-result cap
+    """
+    wanted = min(total_count, max_results, _SEARCH_RESULT_LIMIT)
+    return max(1, -(-wanted // per_page))
+
+# Resolves a login to its owner type in one request
+_OWNER_TYPE_QUERY = 'query($login: String!) { repositoryOwner(login: $login) { __typename } }'
+_OWNER_TYPENAMES = {'Organization': 'org', 'User': 'user'}
+
+# Repository search projected onto the fields most callers read, a fraction
+# of the REST search payload
+_SEARCH_REPOSITORIES_QUERY = (
+    'query($q: String!, $n: Int!) { search(query: $q, type: REPOSITORY, first: $n) { repositoryCount'
+    ' nodes { ... on Repository { databaseId name owner { login } stargazerCount forkCount'
+    ' primaryLanguage { name } updatedAt url description repositoryTopics(first: 20) { nodes { topic { name } } } } } } }'
+)
+
+def _repository_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rename a repository node of _SEARCH_REPOSITORIES_QUERY to the REST API's field names.
+    
+    Args:
+        node: Repository node from a GraphQL search
+        
+    Returns:
+        Dictionary with the REST keys id, name, owner.login, stargazers_count,
+        forks_count, language, updated_at, html_url, description and topics
+    """
+    return {
+        'id': node['databaseId'],
+        'name': node['name'],
+        'owner': {'login': node['owner']['login']},
+        'stargazers_count': node['stargazerCount'],
+        'forks_count': node['forkCount'],
+        'language': (node['primaryLanguage'] or {}).get('name'),
+        'updated_at': node['updatedAt'],
+        'html_url': node['url'],
+        'description': node['description'],
+        'topics': [topic['topic']['name'] for topic in node['repositoryTopics']['nodes']]
+    }
+
+def _graphql_data(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the 'data' object from a GraphQL response body.
+    
+    Args:
+        payload: Parsed GraphQL response
+        
+    Returns:
+        The 'data' object. Fields that failed (e.g. a repository that
+        doesn't exist) are null and logged as warnings.
+        
+    Raises:
+        GitHubAPIError: If the query failed outright
+    """
+    errors = payload.get('errors')
+    if payload.get('data') is None:
+        raise GitHubAPIError(f"GraphQL query failed: {errors}")
+    if errors:
+        logger.warning("GraphQL query returned %d error(s), first: %s", len(errors), errors[0].get('message'))
+    return payload['data']
+
+def _get_retry_after(status_code: int, headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Work out how long to wait before retrying a rate-limited response.
+    
+    Shared by both clients; works with requests and httpx headers alike.
+    
+    Args:
+        status_code: HTTP status code of the response
+        headers: Response headers
+        
+    Returns:
+        Seconds to wait, or None if the response shouldn't be retried
+    """
+    if status_code not in (403, 429):
+        return None
+    
+    retry_after = headers.get(_HDR_RETRY_AFTER)
+    if retry_after is not None:
+        try:
+            wait_time = int(retry_after)
+        except ValueError:
+            return None
+    elif headers.get(_HDR_REMAINING) == '0':
+        wait_time = max(0, int(headers.get(_HDR_RESET, 0)) - int(time.time()))
+    else:
+        return None
+    
+    return wait_time if wait_time <= _MAX_RATE_LIMIT_WAIT else None
+
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors"""
     pass
@@ -38,33 +334,6 @@ class RateLimitError(GitHubAPIError):
     """Exception raised when rate limit is exceeded"""
     pass
 
-def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0):
-    """
-    Decorator to implement retry logic with exponential backoff for transient failures.
-    
-    Args:
-        max_retries: Maximum number of retry attempts
-        base_delay: Base delay in seconds between retries
-    """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except (requests.exceptions.RequestException, RateLimitError) as e:
-                    if attempt == max_retries:
-                        logger.error(f"Max retries exceeded for {func.__name__}: {str(e)}")
-                        raise
-                    
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {delay}s")
-                    time.sleep(delay)
-            
-            return func(*args, **kwargs)
-        return wrapper
-    return decorator
-
 class GitHubAPIClient:
     """
     GitHub API client with proper error handling, rate limiting, and security practices.
@@ -90,16 +359,199 @@ class GitHubAPIClient:
             logger.warning("No GitHub token provided. API requests will be rate-limited.")
         
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
+        # GitHub sends "Cache-Control: max-age=60" on every response; honoring it
+        # (cache_control=True) would override the per-URL lifetimes above, so the
+        # lifetimes are set explicitly and ETags handle revalidation. Accept and
+        # Range are part of the cache key because raw and ranged README requests
+        # share a URL with the JSON one. Each token gets its own cache file.
+        self.session = requests_cache.CachedSession(
+            _cache_path_for(self.token),
+            backend='sqlite',
+            expire_after=_CACHE_EXPIRE_AFTER,
+            urls_expire_after=_CACHE_URLS_EXPIRE_AFTER,
+            allowable_codes=(200, 206),
+            match_headers=['Accept', 'Range'],
+            stale_if_error=True,
+            serializer=_CACHE_SERIALIZER
+        )
+        
+        # Keep a pool of keep-alive connections large enough for concurrent README
+        # fetches and parallel pagination. The adapter retries transient
+        # failures; rate limits are left to _send.
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=_TRANSIENT_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Set headers for authentication and API version
         self.session.headers.update({
             'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'User-Agent': 'Azure-Function-GitHub-Query-Client/1.0'
         })
         
         if self.token:
             self.session.headers['Authorization'] = f'token {self.token}'
+        
+        # Rate-limit state shared by the pagination worker threads: timestamps of
+        # requests sent in the last hour, and the pacing derived from headers
+        self._rate_lock = threading.Lock()
+        self._request_times = deque()
+        self._hourly_limit = _HOURLY_LIMIT_AUTHENTICATED if self.token else _HOURLY_LIMIT_ANONYMOUS
+        self._min_interval = 0.0
+        self._next_allowed_time = 0.0
+        # X-RateLimit-Remaining and reset time of the last core response;
+        # None until one arrives
+        self._remaining: Optional[int] = None
+        self._reset_time = 0.0
+        
+        # Open the TLS connection to api.github.com in the background so the
+        # first real request finds it in the pool instead of paying the handshake
+        threading.Thread(target=self._warm_connection, args=(adapter,), daemon=True).start()
+        
+        # Owner login -> 'org' / 'user' (None if neither exists), so repeated
+        # get_repositories(owner_type='auto') calls skip the probe requests
+        self._owner_type_cache: Dict[str, Optional[str]] = {}
+        
+        # (owner, repo, state) -> (newest updated_at, issues by id) from the last
+        # get_repository_issues call, so later calls only fetch what changed;
+        # least recently used first, guarded by _snapshot_lock
+        self._issue_snapshots: "OrderedDict[Tuple[str, str, str], Tuple[str, Dict[int, Dict[str, Any]]]]" = OrderedDict()
+        self._snapshot_lock = threading.Lock()
+    
+    def _warm_connection(self, adapter: HTTPAdapter) -> None:
+        """
+        Send a HEAD request to /rate_limit to leave a keep-alive connection in the pool.
+        
+        GitHub doesn't count /rate_limit against the rate limit, so the
+        warm-up is free even for anonymous clients with 60 requests an hour.
+        It is sent through the adapter rather than the session so the
+        response cache can't answer it without touching the network, and so
+        it isn't counted against the local rate-limit window.
+        
+        Args:
+            adapter: The adapter mounted for https://
+        """
+        try:
+            request = self.session.prepare_request(requests.Request('HEAD', f"{self.base_url}/rate_limit"))
+            response = adapter.send(request, timeout=5)
+            # Reading the (empty) body hands the connection back to the pool
+            response.content
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection pre-warm failed: %s", e)
+    
+    def _throttle(self) -> None:
+        """
+        Block until this client may send another request.
+        
+        Each call reserves the next free slot, so concurrent threads are spaced
+        out rather than all waking at once. Pacing never holds a caller for
+        more than _MAX_RATE_LIMIT_WAIT, and a request is never refused while
+        GitHub reports budget remaining.
+        
+        Raises:
+            RateLimitError: When the budget is exhausted for longer than _MAX_RATE_LIMIT_WAIT
+        """
+        with self._rate_lock:
+            now = time.time()
+            while self._request_times and self._request_times[0] <= now - 3600:
+                self._request_times.popleft()
+            
+            slot = min(max(now, self._next_allowed_time), now + _MAX_RATE_LIMIT_WAIT)
+            if self._remaining == 0:
+                # GitHub said the budget is spent; wait for the reset if it's close
+                budget_slot = self._reset_time
+            elif self._remaining is None and len(self._request_times) >= self._hourly_limit:
+                # No headers yet, so fall back to the local sliding window
+                budget_slot = self._request_times[0] + 3600
+            else:
+                budget_slot = now
+            if budget_slot - now > _MAX_RATE_LIMIT_WAIT:
+                raise RateLimitError(f"Rate limit budget exhausted. Try again in {int(budget_slot - now)} seconds.")
+            slot = max(slot, budget_slot)
+            
+            wait = slot - now
+            self._next_allowed_time = slot + self._min_interval
+        
+        if wait > 0:
+            logger.info("Throttling request for %.2fs to stay within the rate limit", wait)
+            time.sleep(wait)
+    
+    def _track_rate_limit(self, response: requests.Response) -> None:
+        """
+        Record a request against the sliding window and update pacing from its rate limit headers.
+        
+        Responses served from the local cache are skipped: they cost nothing and
+        carry the headers of whenever they were stored.
+        
+        Args:
+            response: The HTTP response object
+        """
+        if getattr(response, 'from_cache', False):
+            return
+        
+        now = time.time()
+        with self._rate_lock:
+            self._request_times.append(now)
+            
+            # The search bucket holds only 30 requests a minute, so it is always
+            # below the threshold; its 403s are handled by _get_retry_after
+            headers = response.headers
+            remaining = headers.get(_HDR_REMAINING)
+            if remaining is None or headers.get(_HDR_RESOURCE) == 'search':
+                return
+            remaining = int(remaining)
+            wait_time = max(0, int(headers.get(_HDR_RESET, 0)) - now)
+            limit = headers.get(_HDR_LIMIT)
+            if limit is not None:
+                self._hourly_limit = int(limit)
+            self._remaining = remaining
+            self._reset_time = now + wait_time
+            
+            if remaining < self._hourly_limit * _RATE_LIMIT_THRESHOLD_FRACTION:
+                # Spread what's left of the budget evenly until the window resets
+                self._min_interval = wait_time / max(1, remaining)
+                self._next_allowed_time = max(self._next_allowed_time, now + self._min_interval)
+            else:
+                self._min_interval = 0.0
+        
+        if remaining < 10:
+            logger.warning("Rate limit nearly exceeded. %s requests remaining. Reset in %ds", remaining, wait_time)
+    
+    def _send(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+              method: str = 'GET', json: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a request, pacing it against GitHub's rate limits.
+        
+        A 403/429 carrying Retry-After (or an exhausted X-RateLimit-Remaining) is
+        retried after exactly the advertised delay; other failures are returned
+        for _handle_response to raise.
+        
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            headers: Extra headers for this request
+            method: HTTP method
+            json: JSON request body
+            
+        Returns:
+            The HTTP response
+        """
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            self._throttle()
+            try:
+                response = self.session.request(method, url, params=params, headers=headers, json=json, timeout=30)
+            except requests.exceptions.Timeout:
+                raise GitHubAPIError("Request timeout")
+            except requests.exceptions.ConnectionError:
+                raise GitHubAPIError("Connection error")
+            
+            self._track_rate_limit(response)
+            retry_after = _get_retry_after(response.status_code, response.headers)
+            if retry_after is None or attempt == _MAX_RATE_LIMIT_RETRIES:
+                return response
+            
+            logger.warning("Rate limited on %s. Retrying in %ss", url, retry_after)
+            time.sleep(retry_after)
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -115,17 +567,8 @@ class GitHubAPIClient:
             RateLimitError: When rate limit is exceeded
             GitHubAPIError: For other API errors
         """
-        # Check rate limit headers
-        if 'X-RateLimit-Remaining' in response.headers:
-            remaining = int(response.headers['X-RateLimit-Remaining'])
-            if remaining < 10:
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                current_time = int(time.time())
-                wait_time = max(0, reset_time - current_time)
-                logger.warning(f"Rate limit nearly exceeded. {remaining} requests remaining. Reset in {wait_time}s")
-        
-        if response.status_code == 403 and 'rate limit exceeded' in response.text.lower():
-            reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        if response.status_code == 429 or (response.status_code == 403 and 'rate limit exceeded' in response.text.lower()):
+            reset_time = int(response.headers.get(_HDR_RESET, 0))
             current_time = int(time.time())
             wait_time = max(0, reset_time - current_time)
             raise RateLimitError(f"Rate limit exceeded. Try again in {wait_time} seconds.")
@@ -139,32 +582,156 @@ class GitHubAPIClient:
             raise GitHubAPIError(error_msg)
         
         try:
-            return response.json()
+            return orjson.loads(response.content)
         except ValueError as e:
             raise GitHubAPIError(f"Invalid JSON response: {str(e)}")
     
-    @retry_with_exponential_backoff(max_retries=3)
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None, return_headers: bool = False) -> Any:
         """
         Make a request to the GitHub API with proper error handling.
         
         Args:
             endpoint: API endpoint (relative to base URL)
             params: Query parameters
+            return_headers: If True, also return the response headers
+            
+        Returns:
+            Parsed JSON response, or a (json, headers) tuple if return_headers is True
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        
+        # Hot path: skip building the log record when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Making request to: %s", url)
+        response = self._send(url, params=params)
+        data = self._handle_response(response)
+        return (data, response.headers) if return_headers else data
+    
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a query against the GitHub GraphQL API.
+        
+        Args:
+            query: GraphQL document
+            variables: Values for the document's variables
+            
+        Returns:
+            The 'data' object of the response. Fields that failed (e.g. a
+            repository that doesn't exist) are null and logged as warnings.
+            
+        Raises:
+            GitHubAPIError: If no token is configured or the query fails outright
+        """
+        if not self.token:
+            raise GitHubAPIError("The GraphQL API requires a GitHub token")
+        
+        url = f"{self.base_url}/graphql"
+        
+        logger.info("Making GraphQL request to: %s", url)
+        response = self._send(url, method='POST', json={'query': query, 'variables': variables or {}})
+        return _graphql_data(self._handle_response(response))
+    
+    def _make_raw_request(self, endpoint: str, headers: Optional[Dict] = None) -> requests.Response:
+        """
+        Make a request to the GitHub API and return the raw response without JSON parsing.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            headers: Extra headers for this request (e.g. Accept, Range)
             
         Returns:
-            Parsed JSON response
+            The successful (2xx) HTTP response
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
+        logger.info("Making raw request to: %s", url)
+        response = self._send(url, headers=headers)
+        
+        if not response.ok:
+            self._handle_response(response)  # Raises the appropriate error
+        return response
+    
+    def _iter_pages(self, endpoint: str, params: Dict[str, Any], description: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every item of a list endpoint, page by page.
+        
+        The first page's Link header says how many pages exist, so pages 2..N
+        are fetched in parallel rather than probed one by one. Items are
+        yielded as soon as their page (and every page before it) has arrived,
+        so callers can start work after the first round-trip and never need
+        to hold the whole listing.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters, excluding 'page'
+            description: What is being fetched, for log messages
+            
+        Yields:
+            Items from all pages, in page order
+        """
+        first_page, headers = self._make_request(endpoint, {**params, 'page': 1}, return_headers=True)
+        yield from first_page
+        yield from self._iter_page_range(endpoint, params, _parse_last_page(headers.get(_HDR_LINK)), description)
+    
+    def _search(self, endpoint: str, params: Dict[str, Any], description: str) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """
+        Fetch the first page of a search endpoint and iterate over every result.
+        
+        The first page is requested immediately so callers can check
+        total_count before deciding whether to consume the results.
+        
+        Args:
+            endpoint: Search endpoint (relative to base URL)
+            params: Query parameters including 'q', excluding 'page'
+            description: What is being fetched, for log messages
+            
+        Returns:
+            Tuple of (first page response, iterator over the items of all pages in page order)
+        """
+        first_page, headers = self._make_request(endpoint, {**params, 'page': 1}, return_headers=True)
+        last_page = _parse_last_page(headers.get(_HDR_LINK))
+        items = itertools.chain(
+            first_page.get('items', []),
+            self._iter_page_range(endpoint, params, last_page, description, items_key='items')
+        )
+        return first_page, items
+    
+    def _iter_page_range(self, endpoint: str, params: Dict[str, Any], last_page: int, description: str,
+                         items_key: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of pages 2..last_page, fetched in parallel on a thread pool.
+        
+        requests.Session is safe to share across these threads and its
+        connection pool is reused.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters, excluding 'page'
+            last_page: Last page number, from the first page's Link header
+            description: What is being fetched, for log messages
+            items_key: Key holding the item list when pages are objects (search results)
+            
+        Yields:
+            Items from pages 2..last_page, in page order
+        """
+        if last_page > 100:  # Safety check
+            logger.warning("Stopping pagination after 100 pages for %s", description)
+            last_page = 100
+        
+        if last_page <= 1:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=min(_PAGINATION_WORKERS, last_page - 1))
         try:
-            logger.info(f"Making request to: {url}")
-            response = self.session.get(url, params=params, timeout=30)
-            return self._handle_response(response)
-        except requests.exceptions.Timeout:
-            raise GitHubAPIError("Request timeout")
-        except requests.exceptions.ConnectionError:
-            raise GitHubAPIError("Connection error")
+            pages = executor.map(
+                lambda page: self._make_request(endpoint, {**params, 'page': page}),
+                range(2, last_page + 1)
+            )
+            for data in pages:
+                yield from (data[items_key] if items_key else data)
+        finally:
+            # If the caller stopped early, don't fetch pages nobody will read
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def get_repositories(self, owner_name: str, owner_type: str = "auto", per_page: int = 100) -> List[Dict[str, Any]]:
         """
@@ -193,46 +760,74 @@ class GitHubAPIClient:
         if owner_type not in ['org', 'user']:
             raise ValueError("Owner type must be 'org', 'user', or 'auto'")
         
-        logger.info(f"Fetching repositories for {owner_type}: {owner_name}")
+        repositories = list(self._iter_repositories(owner_name, owner_type, per_page))
         
-        repositories = []
-        page = 1
+        logger.info("Found %d repositories for %s %s", len(repositories), owner_type, owner_name)
+        return repositories
+    
+    def iter_repositories(self, owner_name: str, owner_type: str = "auto", per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the repositories of an organization or user, page by page.
         
-        # Use appropriate endpoint based on owner type
-        endpoint = f"orgs/{owner_name}/repos" if owner_type == "org" else f"users/{owner_name}/repos"
+        No repository page is fetched until the iterator is consumed, and
+        later pages only once the first has been read, so
+        itertools.islice(client.iter_repositories(...), n) with per_page=n
+        needs one page request. With owner_type="auto" the owner type is
+        detected first, when this method is called, which costs one more
+        request unless it is already cached.
         
-        while True:
-            params = {
-                'per_page': min(per_page, 100),  # GitHub API max is 100
-                'page': page,
-                'sort': 'updated',
-                'direction': 'desc'
-            }
-            
-            data = self._make_request(endpoint, params)
-            
-            if not data:  # Empty response means no more pages
-                break
-                
-            repositories.extend(data)
+        Args:
+            owner_name: Name of the GitHub organization or user
+            owner_type: Type of owner ('org', 'user', or 'auto' to detect automatically)
+            per_page: Number of repositories per page (max 100)
             
-            # If we got less than the requested per_page, we're on the last page
-            if len(data) < params['per_page']:
-                break
-                
-            page += 1
+        Returns:
+            Iterator over repository information dictionaries, most recently updated first
             
-            # Safety check to prevent infinite loops
-            if page > 100:  # Arbitrary limit
-                logger.warning(f"Stopping pagination after 100 pages for {owner_type} {owner_name}")
-                break
+        Raises:
+            GitHubAPIError: If an API request fails
+        """
+        if not owner_name or not owner_name.strip():
+            raise ValueError("Owner name cannot be empty")
         
-        logger.info(f"Found {len(repositories)} repositories for {owner_type} {owner_name}")
-        return repositories
+        owner_name = owner_name.strip()
+        
+        if owner_type == "auto":
+            owner_type = self._detect_owner_type(owner_name)
+        
+        if owner_type not in ['org', 'user']:
+            raise ValueError("Owner type must be 'org', 'user', or 'auto'")
+        
+        return self._iter_repositories(owner_name, owner_type, per_page)
+    
+    def _iter_repositories(self, owner_name: str, owner_type: str, per_page: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the repositories of a validated owner as their pages arrive.
+        
+        Args:
+            owner_name: Name of the GitHub organization or user
+            owner_type: 'org' or 'user'
+            per_page: Number of repositories per page (max 100)
+        """
+        logger.info("Fetching repositories for %s: %s", owner_type, owner_name)
+        
+        # Use appropriate endpoint based on owner type
+        endpoint = f"orgs/{owner_name}/repos" if owner_type == "org" else f"users/{owner_name}/repos"
+        params = {
+            'per_page': min(per_page, 100),  # GitHub API max is 100
+            'sort': 'updated',
+            'direction': 'desc'
+        }
+        
+        yield from self._iter_pages(endpoint, params, f"{owner_type} {owner_name}")
     
     def _detect_owner_type(self, owner_name: str) -> str:
         """
-        Detect if the owner is an organization or user by making API calls.
+        Detect if the owner is an organization or user.
+        
+        With a token this is a single GraphQL query; without one (GraphQL
+        requires authentication), or if that query fails, the orgs/ and
+        users/ REST endpoints are probed in turn.
         
         Args:
             owner_name: Name of the GitHub owner
@@ -243,17 +838,39 @@ class GitHubAPIClient:
         Raises:
             GitHubAPIError: If neither org nor user exists
         """
+        # Logins are case-insensitive; None records an owner known not to exist
+        key = owner_name.lower()
+        if key not in self._owner_type_cache and self.token:
+            try:
+                data = self.graphql(_OWNER_TYPE_QUERY, {'login': owner_name})
+            except GitHubAPIError as e:
+                logger.warning("GraphQL owner lookup for %s failed, falling back to REST: %s", owner_name, e)
+            else:
+                owner = data.get('repositoryOwner')
+                self._owner_type_cache[key] = _OWNER_TYPENAMES.get(owner['__typename']) if owner else None
+        
+        if key in self._owner_type_cache:
+            owner_type = self._owner_type_cache[key]
+            if owner_type is None:
+                raise GitHubAPIError(f"Owner '{owner_name}' not found as organization or user")
+            return owner_type
+        
         try:
             # Try organization endpoint first
             self._make_request(f"orgs/{owner_name}")
-            return "org"
+            owner_type = "org"
         except GitHubAPIError:
             try:
                 # Try user endpoint
                 self._make_request(f"users/{owner_name}")
-                return "user"
-            except GitHubAPIError:
+                owner_type = "user"
+            except GitHubAPIError as e:
+                if "not found" in str(e).lower():
+                    self._owner_type_cache[key] = None
                 raise GitHubAPIError(f"Owner '{owner_name}' not found as organization or user")
+        
+        self._owner_type_cache[key] = owner_type
+        return owner_type
     
     def get_organization_repositories(self, org_name: str, per_page: int = 100) -> List[Dict[str, Any]]:
         """
@@ -291,13 +908,15 @@ class GitHubAPIClient:
         """
         return self.get_repositories(username, owner_type="user", per_page=per_page)
     
-    def get_repository_readme(self, owner: str, repo_name: str) -> Optional[str]:
+    def get_repository_readme(self, owner: str, repo_name: str, max_bytes: Optional[int] = None) -> Optional[str]:
         """
         Get the README.md content for a specific repository.
         
         Args:
             owner: Repository owner (organization or user)
             repo_name: Repository name
+            max_bytes: If set, only download the first max_bytes of the README
+                using an HTTP Range request on the raw file
             
         Returns:
             README content as string, or None if not found
@@ -311,38 +930,34 @@ class GitHubAPIClient:
         owner = owner.strip()
         repo_name = repo_name.strip()
         
-        logger.info(f"Fetching README for repository: {owner}/{repo_name}")
+        if not max_bytes:
+            content = self.get_repository_readme_bytes(owner, repo_name)
+            return None if content is None else content.decode('utf-8', errors='replace')
+        
+        logger.info("Fetching README for repository: %s/%s", owner, repo_name)
         
         try:
-            data = self._make_request(f"repos/{owner}/{repo_name}/readme")
-            
-            # README content is base64 encoded
-            if 'content' in data:
-                content = base64.b64decode(data['content']).decode('utf-8')
-                logger.info(f"Successfully retrieved README for {owner}/{repo_name}")
-                return content
-            else:
-                logger.warning(f"No content found in README response for {owner}/{repo_name}")
-                return None
-                
+            return self._get_readme_prefix(owner, repo_name, max_bytes)
         except GitHubAPIError as e:
             if "not found" in str(e).lower():
-                logger.info(f"README not found for repository {owner}/{repo_name}")
+                logger.info("README not found for repository %s/%s", owner, repo_name)
                 return None
             raise
     
-    def get_repository_issues(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> List[Dict[str, Any]]:
+    def get_repository_readme_bytes(self, owner: str, repo_name: str) -> Optional[bytes]:
         """
-        Get issues for a specific repository.
+        Get the README.md of a specific repository as undecoded bytes.
+        
+        Useful when only part of the README is needed, e.g. the text around a
+        search match: the caller can search the bytes and decode just that
+        window instead of the whole file.
         
         Args:
             owner: Repository owner (organization or user)
             repo_name: Repository name
-            state: Issue state ('open', 'closed', or 'all')
-            per_page: Number of issues per page (max 100)
             
         Returns:
-            List of issue information dictionaries
+            README content as UTF-8 bytes, or None if not found
             
         Raises:
             GitHubAPIError: If the API request fails
@@ -350,47 +965,268 @@ class GitHubAPIClient:
         if not owner or not repo_name:
             raise ValueError("Owner and repository name cannot be empty")
         
-        if state not in ['open', 'closed', 'all']:
-            raise ValueError("State must be 'open', 'closed', or 'all'")
-        
         owner = owner.strip()
         repo_name = repo_name.strip()
         
-        logger.info(f"Fetching {state} issues for repository: {owner}/{repo_name}")
+        logger.info("Fetching README for repository: %s/%s", owner, repo_name)
         
-        issues = []
-        page = 1
+        try:
+            # The raw media type returns the file itself rather than base64 inside JSON
+            response = self._make_raw_request(
+                f"repos/{owner}/{repo_name}/readme",
+                headers={'Accept': _RAW_MEDIA_TYPE}
+            )
+            logger.info("Successfully retrieved README for %s/%s", owner, repo_name)
+            return response.content
+                
+        except GitHubAPIError as e:
+            if "not found" in str(e).lower():
+                logger.info("README not found for repository %s/%s", owner, repo_name)
+                return None
+            raise
+    
+    def _get_readme_prefix(self, owner: str, repo_name: str, max_bytes: int) -> str:
+        """
+        Download at most max_bytes of a README as raw text.
         
-        while True:
-            params = {
-                'state': state,
-                'per_page': min(per_page, 100),
-                'page': page,
-                'sort': 'updated',
-                'direction': 'desc'
+        GitHub answers 206 Partial Content when it honors the Range header. A
+        200 means the full file was sent, so it is truncated locally instead.
+        """
+        response = self._make_raw_request(
+            f"repos/{owner}/{repo_name}/readme",
+            headers={
+                'Accept': _RAW_MEDIA_TYPE,
+                'Range': f'bytes=0-{max_bytes - 1}',
+                # A byte range of a compressed body cannot be decoded on its own
+                'Accept-Encoding': 'identity'
             }
+        )
+        if response.status_code != 206:
+            logger.info("Range not honored for %s/%s README, truncating locally", owner, repo_name)
+        
+        # The cut may land inside a multi-byte character, so drop partial sequences
+        content = response.content[:max_bytes].decode('utf-8', errors='ignore')
+        logger.info("Successfully retrieved README for %s/%s", owner, repo_name)
+        return content
+    
+    def get_repository_readmes_bulk(self, owner: str, repo_names: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get the README content for many repositories of one owner.
+        
+        READMEs are fetched through GraphQL, up to _GRAPHQL_BATCH_SIZE
+        repositories per request, instead of one REST call each. GraphQL
+        returns the text already decoded. Repositories whose README isn't a
+        text file named README.md at HEAD (or all of them, without a token)
+        fall back to get_repository_readme.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_names: Repository names
             
-            data = self._make_request(f"repos/{owner}/{repo_name}/issues", params)
-            
-            if not data:
-                break
-            
-            # Filter out pull requests (GitHub API includes PRs in issues endpoint)
-            filtered_issues = [issue for issue in data if 'pull_request' not in issue]
-            issues.extend(filtered_issues)
+        Returns:
+            Dictionary mapping each repository name to its README content, or None if not found
             
-            if len(data) < params['per_page']:
-                break
+        Raises:
+            GitHubAPIError: If a REST fallback request fails
+        """
+        if not owner or not owner.strip():
+            raise ValueError("Owner name cannot be empty")
+        
+        owner = owner.strip()
+        names = [name.strip() for name in repo_names]
+        readmes: Dict[str, Optional[str]] = {}
+        
+        if self.token:
+            for start in range(0, len(names), _GRAPHQL_BATCH_SIZE):
+                batch = names[start:start + _GRAPHQL_BATCH_SIZE]
+                variables = {'owner': owner, **{f'n{i}': name for i, name in enumerate(batch)}}
+                try:
+                    data = self.graphql(_build_readme_query(len(batch)), variables)
+                except GitHubAPIError as e:
+                    logger.warning("GraphQL README batch for %s failed, falling back to REST: %s", owner, e)
+                    continue
                 
-            page += 1
+                for i, name in enumerate(batch):
+                    blob = (data.get(f'r{i}') or {}).get('object')
+                    # text is null for binary blobs
+                    if blob and blob.get('text') is not None:
+                        readmes[name] = blob['text']
+        
+        for name in names:
+            if name not in readmes:
+                readmes[name] = self.get_repository_readme(owner, name)
+        
+        logger.info("Retrieved READMEs for %d of %d repositories of %s", sum(r is not None for r in readmes.values()), len(names), owner)
+        return readmes
+    
+    def get_repository_issues(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get issues for a specific repository.
+        
+        The first call fetches the full list. Later calls on the same client
+        only ask GitHub for issues updated since the newest one already seen
+        and merge them in, so a steady-state poll costs a page or less.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: Issue state ('open', 'closed', or 'all')
+            per_page: Number of issues per page (max 100)
+            
+        Returns:
+            List of issue information dictionaries, most recently updated first
             
-            if page > 100:  # Safety check
-                logger.warning(f"Stopping pagination after 100 pages for issues in {owner}/{repo_name}")
-                break
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        if state not in ['open', 'closed', 'all']:
+            raise ValueError("State must be 'open', 'closed', or 'all'")
         
-        logger.info(f"Found {len(issues)} {state} issues for repository {owner}/{repo_name}")
+        owner = owner.strip()
+        repo_name = repo_name.strip()
+        
+        key = (owner.lower(), repo_name.lower(), state)
+        with self._snapshot_lock:
+            snapshot = self._issue_snapshots.get(key)
+        if snapshot is None:
+            issues = list(self._iter_issues(owner, repo_name, state, per_page))
+            by_id = {issue['id']: issue for issue in issues}
+        else:
+            since, by_id = snapshot
+            by_id = self._merge_issue_updates(owner, repo_name, state, per_page, since, by_id)
+            issues = sorted(by_id.values(), key=itemgetter('updated_at'), reverse=True)
+        
+        if issues:
+            # Replaced rather than mutated so concurrent callers never see a half-merged dict
+            since = max(issue['updated_at'] for issue in issues)
+            with self._snapshot_lock:
+                self._issue_snapshots[key] = (since, by_id)
+                self._issue_snapshots.move_to_end(key)
+                if len(self._issue_snapshots) > _MAX_ISSUE_SNAPSHOTS:
+                    self._issue_snapshots.popitem(last=False)
+        
+        logger.info("Found %d %s issues for repository %s/%s", len(issues), state, owner, repo_name)
         return issues
     
+    def iter_repository_issues(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a repository's issues, page by page.
+        
+        Nothing is fetched until the iterator is consumed, and later pages
+        only once the first has been read, so taking the first n issues with
+        itertools.islice and per_page=n usually costs one request. When the
+        issue search exceeds 1000 results or is incomplete, its first page
+        is discarded and the issues endpoint is paged instead, which costs
+        one more. Unlike get_repository_issues(), nothing is kept for
+        incremental refreshes.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: Issue state ('open', 'closed', or 'all')
+            per_page: Number of issues per page (max 100)
+            
+        Returns:
+            Iterator over issue information dictionaries, most recently updated first
+            
+        Raises:
+            GitHubAPIError: If an API request fails
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        if state not in ['open', 'closed', 'all']:
+            raise ValueError("State must be 'open', 'closed', or 'all'")
+        
+        return self._iter_issues(owner.strip(), repo_name.strip(), state, per_page)
+    
+    def _merge_issue_updates(self, owner: str, repo_name: str, state: str, per_page: int,
+                             since: str, by_id: Dict[int, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Apply the issues updated since the last fetch to a copy of a previous result.
+        
+        The delta is requested with state=all so issues that moved out of the
+        requested state (e.g. an open issue that was closed) are seen and dropped.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: Issue state the previous result was filtered to
+            per_page: Number of issues per page (max 100)
+            since: ISO 8601 updated_at of the newest issue in the previous result
+            by_id: Previous result keyed by issue id
+            
+        Returns:
+            Updated copy of by_id
+        """
+        logger.info("Fetching issues updated since %s for repository: %s/%s", since, owner, repo_name)
+        
+        params = {
+            'state': 'all',
+            'since': since,
+            'per_page': min(per_page, 100),
+            'sort': 'updated',
+            'direction': 'desc'
+        }
+        
+        merged = dict(by_id)
+        for issue in self._iter_pages(f"repos/{owner}/{repo_name}/issues", params, f"issue updates in {owner}/{repo_name}"):
+            if 'pull_request' in issue:
+                continue
+            if state == 'all' or issue['state'] == state:
+                merged[issue['id']] = issue
+            else:
+                merged.pop(issue['id'], None)
+        return merged
+    
+    def _iter_issues(self, owner: str, repo_name: str, state: str, per_page: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a repository's issues, excluding pull requests, as their pages arrive.
+        
+        The issues endpoint mixes pull requests in with issues, so the search
+        API is asked for issues only. Search stops at 1000 results; for larger
+        result sets the issues endpoint is paged instead and pull requests are
+        dropped client-side.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: Issue state ('open', 'closed', or 'all')
+            per_page: Number of issues per page (max 100)
+        """
+        logger.info("Fetching %s issues for repository: %s/%s", state, owner, repo_name)
+        
+        query = f"repo:{owner}/{repo_name} is:issue"
+        if state != 'all':
+            query += f" state:{state}"
+        search_params = {
+            'q': query,
+            'sort': 'updated',
+            'order': 'desc',
+            'per_page': min(per_page, 100)
+        }
+        first_page, issues = self._search("search/issues", search_params, f"issues in {owner}/{repo_name}")
+        
+        if first_page.get('total_count', 0) <= _SEARCH_RESULT_LIMIT and not first_page.get('incomplete_results'):
+            yield from issues
+            return
+        
+        logger.info("Issue search for %s/%s is incomplete or exceeds %s results, using the issues endpoint", owner, repo_name, _SEARCH_RESULT_LIMIT)
+        params = {
+            'state': state,
+            'per_page': min(per_page, 100),
+            'sort': 'updated',
+            'direction': 'desc'
+        }
+        
+        # Filter out pull requests (GitHub API includes PRs in issues endpoint)
+        for issue in self._iter_pages(f"repos/{owner}/{repo_name}/issues", params, f"issues in {owner}/{repo_name}"):
+            if 'pull_request' not in issue:
+                yield issue
+    
     def get_repository_pull_requests(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> List[Dict[str, Any]]:
         """
         Get pull requests for a specific repository.
@@ -416,38 +1252,58 @@ class GitHubAPIClient:
         owner = owner.strip()
         repo_name = repo_name.strip()
         
-        logger.info(f"Fetching {state} pull requests for repository: {owner}/{repo_name}")
+        pull_requests = list(self._iter_pull_requests(owner, repo_name, state, per_page))
+        
+        logger.info("Found %d %s pull requests for repository %s/%s", len(pull_requests), state, owner, repo_name)
+        return pull_requests
+    
+    def iter_repository_pull_requests(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a repository's pull requests, page by page.
         
-        pull_requests = []
-        page = 1
+        Nothing is fetched until the iterator is consumed, and later pages
+        only once the first has been read.
         
-        while True:
-            params = {
-                'state': state,
-                'per_page': min(per_page, 100),
-                'page': page,
-                'sort': 'updated',
-                'direction': 'desc'
-            }
-            
-            data = self._make_request(f"repos/{owner}/{repo_name}/pulls", params)
-            
-            if not data:
-                break
-            
-            pull_requests.extend(data)
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: PR state ('open', 'closed', or 'all')
+            per_page: Number of PRs per page (max 100)
             
-            if len(data) < params['per_page']:
-                break
-                
-            page += 1
+        Returns:
+            Iterator over pull request information dictionaries, most recently updated first
             
-            if page > 100:  # Safety check
-                logger.warning(f"Stopping pagination after 100 pages for PRs in {owner}/{repo_name}")
-                break
+        Raises:
+            GitHubAPIError: If an API request fails
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
         
-        logger.info(f"Found {len(pull_requests)} {state} pull requests for repository {owner}/{repo_name}")
-        return pull_requests
+        if state not in ['open', 'closed', 'all']:
+            raise ValueError("State must be 'open', 'closed', or 'all'")
+        
+        return self._iter_pull_requests(owner.strip(), repo_name.strip(), state, per_page)
+    
+    def _iter_pull_requests(self, owner: str, repo_name: str, state: str, per_page: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a repository's pull requests as their pages arrive.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: PR state ('open', 'closed', or 'all')
+            per_page: Number of PRs per page (max 100)
+        """
+        logger.info("Fetching %s pull requests for repository: %s/%s", state, owner, repo_name)
+        
+        params = {
+            'state': state,
+            'per_page': min(per_page, 100),
+            'sort': 'updated',
+            'direction': 'desc'
+        }
+        
+        yield from self._iter_pages(f"repos/{owner}/{repo_name}/pulls", params, f"PRs in {owner}/{repo_name}")
     
     def get_repository_contributors(self, owner: str, repo_name: str, per_page: int = 100) -> List[Dict[str, Any]]:
         """
@@ -470,35 +1326,50 @@ class GitHubAPIClient:
         owner = owner.strip()
         repo_name = repo_name.strip()
         
-        logger.info(f"Fetching contributors for repository: {owner}/{repo_name}")
+        contributors = list(self._iter_contributors(owner, repo_name, per_page))
         
-        contributors = []
-        page = 1
+        logger.info("Found %d contributors for repository %s/%s", len(contributors), owner, repo_name)
+        return contributors
+    
+    def iter_repository_contributors(self, owner: str, repo_name: str, per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a repository's contributors, page by page.
         
-        while True:
-            params = {
-                'per_page': min(per_page, 100),
-                'page': page
-            }
-            
-            data = self._make_request(f"repos/{owner}/{repo_name}/contributors", params)
-            
-            if not data:
-                break
-            
-            contributors.extend(data)
+        Nothing is fetched until the iterator is consumed, and later pages
+        only once the first has been read.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            per_page: Number of contributors per page (max 100)
             
-            if len(data) < params['per_page']:
-                break
-                
-            page += 1
+        Returns:
+            Iterator over contributor information dictionaries, most contributions first
             
-            if page > 100:  # Safety check
-                logger.warning(f"Stopping pagination after 100 pages for contributors in {owner}/{repo_name}")
-                break
+        Raises:
+            GitHubAPIError: If an API request fails
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
         
-        logger.info(f"Found {len(contributors)} contributors for repository {owner}/{repo_name}")
-        return contributors
+        return self._iter_contributors(owner.strip(), repo_name.strip(), per_page)
+    
+    def _iter_contributors(self, owner: str, repo_name: str, per_page: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a repository's contributors as their pages arrive.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            per_page: Number of contributors per page (max 100)
+        """
+        logger.info("Fetching contributors for repository: %s/%s", owner, repo_name)
+        
+        params = {
+            'per_page': min(per_page, 100)
+        }
+        
+        yield from self._iter_pages(f"repos/{owner}/{repo_name}/contributors", params, f"contributors in {owner}/{repo_name}")
 
     def search_repositories(self, query: str, sort: str = "updated", order: str = "desc", per_page: int = 30) -> Dict[str, Any]:
         """
@@ -531,7 +1402,7 @@ class GitHubAPIClient:
             raise ValueError("Order must be 'asc' or 'desc'")
         
         query = query.strip()
-        logger.info(f"Searching repositories with query: '{query}'")
+        logger.info("Searching repositories with query: '%s'", query)
         
         params = {
             'q': query,
@@ -543,12 +1414,59 @@ class GitHubAPIClient:
         data = self._make_request("search/repositories", params)
         
         if 'total_count' in data and 'items' in data:
-            logger.info(f"Search found {data['total_count']} repositories matching '{query}'")
+            logger.info("Search found %s repositories matching '%s'", data['total_count'], query)
             return data
         else:
-            logger.warning(f"Unexpected search response format for query '{query}'")
+            logger.warning("Unexpected search response format for query '%s'", query)
             return {'total_count': 0, 'items': []}
 
+    def graphql_search_repositories(self, query: str, sort: str = "updated", order: str = "desc", first: int = 30) -> Dict[str, Any]:
+        """
+        Search for repositories through the GraphQL API, fetching only commonly used fields.
+        
+        Each result carries id, name, owner.login, stargazers_count,
+        forks_count, language, updated_at, html_url, description and topics
+        under their REST names, so it can stand in for search_repositories()
+        wherever only those fields are read. Without a token (GraphQL
+        requires one) this falls back to search_repositories().
+        
+        Args:
+            query: Search query string (supports GitHub search syntax)
+            sort: Sort field ('stars', 'forks', 'help-wanted-issues', 'updated')
+            order: Sort order ('asc' or 'desc')
+            first: Number of results (max 100)
+            
+        Returns:
+            Dictionary containing search results with 'total_count' and 'items'
+            
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        if not self.token:
+            return self.search_repositories(query, sort=sort, order=order, per_page=first)
+        
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+        
+        if sort not in ['stars', 'forks', 'help-wanted-issues', 'updated']:
+            raise ValueError("Sort must be one of: stars, forks, help-wanted-issues, updated")
+        
+        if order not in ['asc', 'desc']:
+            raise ValueError("Order must be 'asc' or 'desc'")
+        
+        query = query.strip()
+        logger.info("Searching repositories over GraphQL with query: '%s'", query)
+        
+        # GraphQL search takes the ordering as a qualifier in the query itself
+        variables = {'q': f"{query} sort:{sort}-{order}", 'n': min(first, 100)}
+        search = self.graphql(_SEARCH_REPOSITORIES_QUERY, variables)['search']
+        
+        logger.info("Search found %s repositories matching '%s'", search['repositoryCount'], query)
+        return {
+            'total_count': search['repositoryCount'],
+            'items': [_repository_from_graphql(node) for node in search['nodes'] if node]
+        }
+    
     def search_repositories_paginated(self, query: str, sort: str = "updated", order: str = "desc", 
                                     max_results: int = 100) -> List[Dict[str, Any]]:
         """
@@ -566,60 +1484,600 @@ class GitHubAPIClient:
         Raises:
             GitHubAPIError: If the API request fails
         """
-        repositories = []
-        page = 1
+        if max_results <= 0:
+            return []
+        
         per_page = min(100, max_results)  # GitHub search API max is 100 per page
+        params = {
+            'q': query,
+            'sort': sort,
+            'order': order,
+            'per_page': per_page
+        }
         
-        while len(repositories) < max_results:
-            remaining = max_results - len(repositories)
-            current_per_page = min(per_page, remaining)
+        repositories = []
+        try:
+            # Page 1 gives total_count, which fixes how many pages are needed; the
+            # rest are then fetched in parallel instead of walked one at a time
+            data = self._make_request("search/repositories", {**params, 'page': 1})
+            repositories.extend(data.get('items', []))
             
-            params = {
-                'q': query,
-                'sort': sort,
-                'order': order,
-                'per_page': current_per_page,
-                'page': page
-            }
+            last_page = _search_last_page(data.get('total_count', 0), per_page, max_results)
+            repositories.extend(self._iter_page_range(
+                "search/repositories", params, last_page, f"search '{query}'", items_key='items'
+            ))
+        except GitHubAPIError as e:
+            if "rate limit" not in str(e).lower():
+                raise
+            logger.warning("Rate limit exceeded during search pagination")
+        
+        del repositories[max_results:]
+        logger.info("Retrieved %d repositories from search", len(repositories))
+        return repositories
+
+
+class AsyncGitHubAPIClient:
+    """
+    Asynchronous GitHub API client built on httpx.
+    
+    Mirrors GitHubAPIClient, but multi-page endpoints fetch the first page, read
+    the total page count from its Link header and then request the remaining
+    pages concurrently with asyncio.gather. A K-page listing therefore costs
+    about two round-trips instead of K. Requests are sent over HTTP/2, so those
+    concurrent pages are multiplexed as streams on one TLS connection instead
+    of each needing its own socket.
+    
+    Use it as an async context manager so the HTTP session is closed:
+    
+        async with AsyncGitHubAPIClient() as client:
+            issues = await client.get_repository_issues("microsoft", "vscode")
+    
+    Synchronous callers should keep using GitHubAPIClient.
+    """
+    
+    def __init__(self, token: Optional[str] = None, max_connections_per_host: int = 64):
+        """
+        Initialize the asynchronous GitHub API client.
+        
+        Args:
+            token: GitHub personal access token. If not provided, will try to get from environment.
+            max_connections_per_host: Upper bound on concurrent connections to api.github.com.
+                Over HTTP/2 a single connection usually carries every request.
+        """
+        self.token = token or os.getenv('GITHUB_TOKEN')
+        
+        if not self.token:
+            logger.warning("No GitHub token provided. API requests will be rate-limited.")
+        
+        self.base_url = "https://api.github.com"
+        self.headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'Azure-Function-GitHub-Query-Client/1.0'
+        }
+        
+        if self.token:
+            self.headers['Authorization'] = f'token {self.token}'
+        
+        self.max_connections_per_host = max_connections_per_host
+        self._session: Optional[httpx.AsyncClient] = None
+        self._owner_type_cache: Dict[str, Optional[str]] = {}
+        # (endpoint, params, raw) -> (ETag, Last-Modified, payload, headers), least recently used first
+        self._validators: "OrderedDict[Tuple[str, Tuple, bool], Tuple[Optional[str], Optional[str], Any, Mapping[str, str]]]" = OrderedDict()
+    
+    async def __aenter__(self) -> "AsyncGitHubAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """The shared httpx client, created lazily inside the running event loop."""
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=self.max_connections_per_host),
+                timeout=httpx.Timeout(30.0)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.is_closed:
+            await self._session.aclose()
+    
+    def _handle_response(self, response: httpx.Response) -> Any:
+        """
+        Handle API response with proper error checking and rate limit handling.
+        
+        Args:
+            response: The HTTP response object
+            
+        Returns:
+            Parsed JSON response data
+            
+        Raises:
+            RateLimitError: When rate limit is exceeded
+            GitHubAPIError: For other API errors
+        """
+        remaining = response.headers.get(_HDR_REMAINING)
+        if remaining is not None:
+            remaining = int(remaining)
+            if remaining < 10:
+                wait_time = max(0, int(response.headers.get(_HDR_RESET, 0)) - int(time.time()))
+                logger.warning("Rate limit nearly exceeded. %s requests remaining. Reset in %ss", remaining, wait_time)
+        
+        if response.status_code == 429 or (response.status_code == 403 and 'rate limit exceeded' in response.text.lower()):
+            reset_time = int(response.headers.get(_HDR_RESET, 0))
+            wait_time = max(0, reset_time - int(time.time()))
+            raise RateLimitError(f"Rate limit exceeded. Try again in {wait_time} seconds.")
+        
+        if response.status_code == 404:
+            raise GitHubAPIError(f"Resource not found: {response.url}")
+        
+        if not response.is_success:
+            error_msg = f"GitHub API error {response.status_code}: {response.text}"
+            logger.error(error_msg)
+            raise GitHubAPIError(error_msg)
+        
+        try:
+            return orjson.loads(response.content)
+        except ValueError as e:
+            raise GitHubAPIError(f"Invalid JSON response: {str(e)}")
+    
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None, raw: bool = False,
+                            revalidate: bool = True,
+                            max_retries: int = 3, base_delay: float = 1.0) -> Tuple[Any, Mapping[str, str]]:
+        """
+        Make a request to the GitHub API, retrying transient failures with exponential backoff.
+        
+        A 403/429 carrying Retry-After (or an exhausted X-RateLimit-Remaining)
+        is retried after exactly the advertised delay, as in
+        GitHubAPIClient._send; RateLimitError is raised when that would mean
+        waiting longer than _MAX_RATE_LIMIT_WAIT.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters
+            raw: If True, request the raw media type and return the body bytes unparsed
+            revalidate: If True, remember the response's ETag (or Last-Modified)
+                and payload, and send If-None-Match (or If-Modified-Since) next
+                time; a 304 then returns the remembered payload and headers
+                without counting against the rate limit
+            max_retries: Maximum number of retry attempts
+            base_delay: Base delay in seconds between retries of transport errors
             
+        Returns:
+            Tuple of (parsed JSON response or raw bytes, response headers)
+        """
+        headers = {'Accept': _RAW_MEDIA_TYPE} if raw else None
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        
+        key = (endpoint, tuple(sorted((params or {}).items())), raw)
+        remembered = self._validators.get(key) if revalidate else None
+        if remembered is not None:
+            etag, last_modified, _, _ = remembered
+            conditional = {'If-None-Match': etag} if etag else {'If-Modified-Since': last_modified}
+            headers = {**(headers or {}), **conditional}
+        
+        for attempt in range(max_retries + 1):
             try:
-                data = self._make_request("search/repositories", params)
-                
-                if 'items' not in data or not data['items']:
-                    break
-                
-                repositories.extend(data['items'])
-                
-                # If we got less than requested, we're on the last page
-                if len(data['items']) < current_per_page:
-                    break
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Making request to: %s", url)
+                response = await self.session.get(url, params=params, headers=headers)
+                if remembered is not None and response.status_code == 304:
+                    # A 304 has no Link header, so hand back the original
+                    # response's headers or pagination would stop at page 1
+                    self._validators.move_to_end(key)
+                    return remembered[2], remembered[3]
+                retry_after = _get_retry_after(response.status_code, response.headers)
+                if retry_after is not None and attempt < max_retries:
+                    logger.warning("Rate limited on %s. Retrying in %ss", url, retry_after)
+                    await asyncio.sleep(retry_after)
+                    continue
+                if raw and response.is_success:
+                    data = response.content
+                else:
+                    data = self._handle_response(response)
+                if revalidate:
+                    self._remember(key, response.headers, data)
+                return data, response.headers
+            except httpx.TransportError as e:
+                if attempt == max_retries:
+                    logger.error("Max retries exceeded for %s: %s", url, e)
+                    if isinstance(e, httpx.TimeoutException):
+                        raise GitHubAPIError("Request timeout")
+                    raise GitHubAPIError("Connection error")
                 
-                page += 1
-                
-                # GitHub search API only returns first 1000 results
-                if page > 10:  # 10 pages * 100 per page = 1000 max
-                    logger.warning("Reached GitHub search API limit of 1000 results")
-                    break
-                    
+                delay = base_delay * (2 ** attempt)
+                logger.warning("Attempt %s failed for %s: %s. Retrying in %ss", attempt + 1, url, e, delay)
+                await asyncio.sleep(delay)
+    
+    def _remember(self, key: Tuple[str, Tuple, bool], headers: Mapping[str, str], data: Any) -> None:
+        """
+        Keep a response's validators and payload for the next conditional request.
+        
+        Args:
+            key: (endpoint, sorted params, raw) of the request
+            headers: Response headers
+            data: Parsed payload (or raw bytes) returned to the caller
+        """
+        etag = headers.get(_HDR_ETAG)
+        last_modified = headers.get(_HDR_LAST_MODIFIED)
+        if etag is None and last_modified is None:
+            return
+        
+        self._validators[key] = (etag, last_modified, data, headers)
+        self._validators.move_to_end(key)
+        if len(self._validators) > _MAX_REVALIDATION_ENTRIES:
+            self._validators.popitem(last=False)
+    
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a query against the GitHub GraphQL API.
+        
+        Returns:
+            The 'data' object of the response
+            
+        Raises:
+            GitHubAPIError: If no token is configured or the query fails outright
+        """
+        if not self.token:
+            raise GitHubAPIError("The GraphQL API requires a GitHub token")
+        
+        url = f"{self.base_url}/graphql"
+        
+        try:
+            logger.info("Making GraphQL request to: %s", url)
+            response = await self.session.post(url, json={'query': query, 'variables': variables or {}})
+        except httpx.TimeoutException:
+            raise GitHubAPIError("Request timeout")
+        except httpx.TransportError:
+            raise GitHubAPIError("Connection error")
+        
+        return _graphql_data(self._handle_response(response))
+    
+    async def _paginate(self, endpoint: str, params: Dict[str, Any], revalidate: bool = True) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a list endpoint, requesting pages 2..N concurrently.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters, excluding 'page'
+            revalidate: Revalidate each page with If-None-Match (see _make_request)
+            
+        Returns:
+            Items from all pages, in page order
+        """
+        first_page, headers = await self._make_request(endpoint, {**params, 'page': 1}, revalidate=revalidate)
+        items = list(first_page)
+        
+        last_page = _parse_last_page(headers.get(_HDR_LINK))
+        if last_page > 100:  # Safety check
+            logger.warning("Stopping pagination after 100 pages for %s", endpoint)
+            last_page = 100
+        
+        if last_page > 1:
+            pages = await asyncio.gather(*(
+                self._make_request(endpoint, {**params, 'page': page}, revalidate=revalidate)
+                for page in range(2, last_page + 1)
+            ))
+            for data, _ in pages:
+                items.extend(data)
+        
+        return items
+    
+    async def get_repositories(self, owner_name: str, owner_type: str = "auto", per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get all repositories for a specific organization or user.
+        
+        Args:
+            owner_name: Name of the GitHub organization or user
+            owner_type: Type of owner ('org', 'user', or 'auto' to detect automatically)
+            per_page: Number of repositories per page (max 100)
+            
+        Returns:
+            List of repository information dictionaries
+        """
+        if not owner_name or not owner_name.strip():
+            raise ValueError("Owner name cannot be empty")
+        
+        owner_name = owner_name.strip()
+        
+        if owner_type == "auto":
+            owner_type = await self._detect_owner_type(owner_name)
+        
+        if owner_type not in ['org', 'user']:
+            raise ValueError("Owner type must be 'org', 'user', or 'auto'")
+        
+        endpoint = f"orgs/{owner_name}/repos" if owner_type == "org" else f"users/{owner_name}/repos"
+        params = {'per_page': min(per_page, 100), 'sort': 'updated', 'direction': 'desc'}
+        
+        repositories = await self._paginate(endpoint, params)
+        logger.info("Found %d repositories for %s %s", len(repositories), owner_type, owner_name)
+        return repositories
+    
+    async def _detect_owner_type(self, owner_name: str) -> str:
+        """
+        Detect if the owner is an organization or user.
+        
+        Uses one GraphQL query when a token is set, otherwise probes the
+        orgs/ and users/ REST endpoints.
+        
+        Returns:
+            'org' if it's an organization, 'user' if it's a user
+            
+        Raises:
+            GitHubAPIError: If neither org nor user exists
+        """
+        key = owner_name.lower()
+        if key not in self._owner_type_cache and self.token:
+            try:
+                data = await self.graphql(_OWNER_TYPE_QUERY, {'login': owner_name})
             except GitHubAPIError as e:
-                if "rate limit" in str(e).lower():
-                    logger.warning("Rate limit exceeded during search pagination")
+                logger.warning("GraphQL owner lookup for %s failed, falling back to REST: %s", owner_name, e)
+            else:
+                owner = data.get('repositoryOwner')
+                self._owner_type_cache[key] = _OWNER_TYPENAMES.get(owner['__typename']) if owner else None
+        
+        if key in self._owner_type_cache:
+            owner_type = self._owner_type_cache[key]
+            if owner_type is None:
+                raise GitHubAPIError(f"Owner '{owner_name}' not found as organization or user")
+            return owner_type
+        
+        try:
+            await self._make_request(f"orgs/{owner_name}")
+            owner_type = "org"
+        except GitHubAPIError:
+            try:
+                await self._make_request(f"users/{owner_name}")
+                owner_type = "user"
+            except GitHubAPIError as e:
+                if "not found" in str(e).lower():
+                    self._owner_type_cache[key] = None
+                raise GitHubAPIError(f"Owner '{owner_name}' not found as organization or user")
+        
+        self._owner_type_cache[key] = owner_type
+        return owner_type
+    
+    async def get_repository_readme(self, owner: str, repo_name: str) -> Optional[str]:
+        """
+        Get the README.md content for a specific repository.
+        
+        Returns:
+            README content as string, or None if not found
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        owner = owner.strip()
+        repo_name = repo_name.strip()
+        
+        try:
+            content, _ = await self._make_request(f"repos/{owner}/{repo_name}/readme", raw=True)
+        except GitHubAPIError as e:
+            if "not found" in str(e).lower():
+                logger.info("README not found for repository %s/%s", owner, repo_name)
+                return None
+            raise
+        
+        return content.decode('utf-8', errors='replace')
+    
+    async def get_repository_issues(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get issues (excluding pull requests) for a specific repository.
+        
+        Returns:
+            List of issue information dictionaries
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        if state not in ['open', 'closed', 'all']:
+            raise ValueError("State must be 'open', 'closed', or 'all'")
+        
+        owner = owner.strip()
+        repo_name = repo_name.strip()
+        
+        params = {'state': state, 'per_page': min(per_page, 100), 'sort': 'updated', 'direction': 'desc'}
+        data = await self._paginate(f"repos/{owner}/{repo_name}/issues", params)
+        
+        # Filter out pull requests (GitHub API includes PRs in issues endpoint)
+        issues = [issue for issue in data if 'pull_request' not in issue]
+        logger.info("Found %d %s issues for repository %s/%s", len(issues), state, owner, repo_name)
+        return issues
+    
+    async def iter_issues(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100,
+                          transform: Optional[Callable[[Dict[str, Any]], Any]] = None) -> AsyncIterator[Any]:
+        """
+        Yield a repository's issues (excluding pull requests) page by page.
+        
+        Pages 2..N are requested concurrently as soon as the first page's Link
+        header is read, and yielded in page order. When a transform is given,
+        each page's filtering and transformation runs in a worker process so
+        heavy post-processing (schema normalization, markdown extraction, ...)
+        never stalls the event loop. Without one, the pull request filter is
+        cheaper than shipping the page to another process and runs inline.
+        
+        Args:
+            owner: Repository owner (organization or user)
+            repo_name: Repository name
+            state: Issue state ('open', 'closed', or 'all')
+            per_page: Number of issues per page (max 100)
+            transform: Picklable (module-level) function applied to each issue
+            
+        Yields:
+            Issues, or transform(issue) if a transform was given
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        if state not in ['open', 'closed', 'all']:
+            raise ValueError("State must be 'open', 'closed', or 'all'")
+        
+        owner = owner.strip()
+        repo_name = repo_name.strip()
+        
+        endpoint = f"repos/{owner}/{repo_name}/issues"
+        params = {'state': state, 'per_page': min(per_page, 100), 'sort': 'updated', 'direction': 'desc'}
+        
+        data, headers = await self._make_request(endpoint, {**params, 'page': 1})
+        last_page = _parse_last_page(headers.get(_HDR_LINK))
+        if last_page > 100:  # Safety check
+            logger.warning("Stopping pagination after 100 pages for %s", endpoint)
+            last_page = 100
+        
+        tasks = [
+            asyncio.ensure_future(self._make_request(endpoint, {**params, 'page': page}))
+            for page in range(2, last_page + 1)
+        ]
+        loop = asyncio.get_running_loop()
+        try:
+            pending = iter(tasks)
+            while True:
+                if transform is None:
+                    items = _post_process_issues(data)
+                else:
+                    items = await loop.run_in_executor(_process_pool(), _post_process_issues, data, transform)
+                for item in items:
+                    yield item
+                
+                task = next(pending, None)
+                if task is None:
                     break
-                raise
+                data, _ = await task
+        finally:
+            # If the caller stopped early, don't fetch pages nobody will read;
+            # gathering the cancelled tasks retrieves any exception they already
+            # raised so asyncio doesn't log "Task exception was never retrieved"
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def get_repository_pull_requests(self, owner: str, repo_name: str, state: str = "open", per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get pull requests for a specific repository.
+        
+        Returns:
+            List of pull request information dictionaries
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        if state not in ['open', 'closed', 'all']:
+            raise ValueError("State must be 'open', 'closed', or 'all'")
+        
+        owner = owner.strip()
+        repo_name = repo_name.strip()
         
-        logger.info(f"Retrieved {len(repositories)} repositories from search")
+        params = {'state': state, 'per_page': min(per_page, 100), 'sort': 'updated', 'direction': 'desc'}
+        pull_requests = await self._paginate(f"repos/{owner}/{repo_name}/pulls", params)
+        logger.info("Found %d %s pull requests for repository %s/%s", len(pull_requests), state, owner, repo_name)
+        return pull_requests
+    
+    async def get_repository_contributors(self, owner: str, repo_name: str, per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get contributors for a specific repository.
+        
+        Returns:
+            List of contributor information dictionaries
+        """
+        if not owner or not repo_name:
+            raise ValueError("Owner and repository name cannot be empty")
+        
+        owner = owner.strip()
+        repo_name = repo_name.strip()
+        
+        params = {'per_page': min(per_page, 100)}
+        contributors = await self._paginate(f"repos/{owner}/{repo_name}/contributors", params)
+        logger.info("Found %d contributors for repository %s/%s", len(contributors), owner, repo_name)
+        return contributors
+    
+    async def search_repositories(self, query: str, sort: str = "updated", order: str = "desc", per_page: int = 30) -> Dict[str, Any]:
+        """
+        Search for repositories using GitHub's search API.
+        
+        Returns:
+            Dictionary containing search results with 'total_count' and 'items'
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+        
+        if sort not in ['stars', 'forks', 'help-wanted-issues', 'updated']:
+            raise ValueError("Sort must be one of: stars, forks, help-wanted-issues, updated")
+        
+        if order not in ['asc', 'desc']:
+            raise ValueError("Order must be 'asc' or 'desc'")
+        
+        query = query.strip()
+        params = {'q': query, 'sort': sort, 'order': order, 'per_page': min(per_page, 100)}
+        data, _ = await self._make_request("search/repositories", params)
+        
+        if 'total_count' in data and 'items' in data:
+            logger.info("Search found %s repositories matching '%s'", data['total_count'], query)
+            return data
+        logger.warning("Unexpected search response format for query '%s'", query)
+        return {'total_count': 0, 'items': []}
+    
+    async def search_repositories_paginated(self, query: str, sort: str = "updated", order: str = "desc",
+                                            max_results: int = 100) -> List[Dict[str, Any]]:
+        """
+        Search for repositories, fetching every needed page concurrently.
+        
+        Page 1 gives total_count; the remaining pages (at most 10, the search
+        API's 1000-result cap) are then requested together with asyncio.gather.
+        
+        Returns:
+            List of repository dictionaries
+        """
+        if max_results <= 0:
+            return []
+        
+        per_page = min(100, max_results)
+        params = {'q': query, 'sort': sort, 'order': order, 'per_page': per_page}
+        
+        data, _ = await self._make_request("search/repositories", {**params, 'page': 1})
+        repositories = list(data.get('items', []))
+        
+        last_page = _search_last_page(data.get('total_count', 0), per_page, max_results)
+        pages = await asyncio.gather(*(
+            self._make_request("search/repositories", {**params, 'page': page})
+            for page in range(2, last_page + 1)
+        ))
+        for page_data, _ in pages:
+            repositories.extend(page_data.get('items', []))
+        
+        del repositories[max_results:]
+        logger.info("Retrieved %d repositories from search", len(repositories))
         return repositories
 
 
 # Convenience functions for Azure Function App integration
+# Clients handed out by create_github_client, keyed by token, so warm Function
+# invocations reuse one session, its connection pool and its rate-limit state
+_CLIENT_CACHE: Dict[str, GitHubAPIClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 def create_github_client() -> GitHubAPIClient:
     """
-    Create a GitHub API client with token from environment variables.
+    Get the shared GitHub API client for the token in the environment.
+    
+    The client is created on first use and reused afterwards by every caller
+    in the process that has the same GITHUB_TOKEN.
     
     Returns:
         Configured GitHubAPIClient instance
     """
-    return GitHubAPIClient()
+    token = os.getenv('GITHUB_TOKEN', '')
+    client = _CLIENT_CACHE.get(token)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(token)
+            if client is None:
+                client = _CLIENT_CACHE[token] = GitHubAPIClient(token or None)
+    return client
 
 
 # Example usage and testing functions
@@ -685,7 +2143,7 @@ def main():
             print(f"- {contributor['login']}: {contributor['contributions']} contributions")
     
     except Exception as e:
-        logger.error(f"Error in main: {str(e)}")
+        logger.error("Error in main: %s", e)
         print(f"Error: {str(e)}")
 
 
@@ -3,7 +3,28 @@
 Script to search GitHub for repositories that use Kinect devices.
 """
 
-from queryGitHub import create_github_client
+import heapq
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from queryGitHub import GitHubAPIError, create_github_client
+
+# Case-insensitive match on repository names, descriptions and topics
+_KINECT_RE = re.compile(r'kinect', re.IGNORECASE)
+# Case-insensitive match over undecoded README bytes, so only the snippet
+# window is decoded. A single pass; probing common spellings with bytes.find
+# first only adds scans when a README doesn't mention Kinect at all.
+_KINECT_BYTES_RE = re.compile(rb'kinect', re.IGNORECASE)
+# Runs of whitespace (including newlines) collapse to one space in README snippets
+_WS_RE = re.compile(r'\s+')
+
+# Number of repositories shown, ranked by stars
+_TOP_N = 20
+# Searches in flight at once; the rest wait in the queue so they can be
+# cancelled once the top _TOP_N stops changing
+_SEARCH_WORKERS = 3
 
 def search_kinect_repositories():
     """Search for GitHub repositories that use Kinect devices"""
@@ -23,86 +44,122 @@ def search_kinect_repositories():
     ]
     
     try:
-        all_repos = []
-        seen_repos = set()  # To avoid duplicates
+        # repository id -> repo; first-seen order is kept and duplicates are skipped
+        all_repos = {}
+        # Min-heap of the star counts of the best _TOP_N repositories so far
+        top_stars = []
         
-        for query in search_queries:
-            print(f"🔍 Searching with query: '{query}'")
-            search_results = client.search_repositories(query, sort="stars", order="desc", per_page=15)
+        # Each search is a network round-trip, so run several at once and
+        # merge the results as they come back
+        with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS) as executor:
+            futures = {}
+            for query in search_queries:
+                print(f"🔍 Searching with query: '{query}'")
+                future = executor.submit(client.graphql_search_repositories, query, sort="stars", order="desc", first=15)
+                futures[future] = query
+            print()
             
-            if 'items' in search_results:
-                new_repos = 0
-                for repo in search_results['items']:
-                    repo_key = f"{repo['owner']['login']}/{repo['name']}"
-                    if repo_key not in seen_repos:
-                        seen_repos.add(repo_key)
-                        all_repos.append(repo)
-                        new_repos += 1
+            for future in as_completed(futures):
+                query = futures[future]
+                search_results = future.result()
                 
-                print(f"   Found {len(search_results['items'])} results, {new_repos} new unique repos")
-            else:
-                print(f"   No results found")
-            
-            # Limit to avoid too many API calls
-            if len(all_repos) >= 30:
-                break
+                improved_top = False
+                if 'items' in search_results:
+                    new_repos = 0
+                    for repo in search_results['items']:
+                        if repo['id'] not in all_repos:
+                            all_repos[repo['id']] = repo
+                            new_repos += 1
+                            stars = repo.get('stargazers_count', 0)
+                            if len(top_stars) < _TOP_N:
+                                heapq.heappush(top_stars, stars)
+                                improved_top = True
+                            elif stars > top_stars[0]:
+                                heapq.heappushpop(top_stars, stars)
+                                improved_top = True
+                    
+                    print(f"   '{query}': found {len(search_results['items'])} results, {new_repos} new unique repos")
+                else:
+                    print(f"   '{query}': no results found")
+                
+                # Limit to avoid too many API calls, and stop once a whole
+                # query failed to change the top _TOP_N by stars
+                if len(all_repos) >= 30 or (len(top_stars) == _TOP_N and not improved_top):
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
         
         print(f"\n📊 Total unique Kinect-related repositories found: {len(all_repos)}")
         print("=" * 80)
         
-        # Sort by stars for better results
-        all_repos.sort(key=lambda x: x.get('stargazers_count', 0), reverse=True)
+        # Top _TOP_N by stars; a bounded heap avoids ordering the whole result set
+        top_repos = heapq.nlargest(_TOP_N, all_repos.values(), key=lambda x: x.get('stargazers_count', 0))
+        
+        # A README snippet only adds context when the name, description and
+        # topics don't already mention Kinect, so only those READMEs are fetched
+        def needs_readme(repo):
+            return not (_KINECT_RE.search(repo['name'])
+                        or _KINECT_RE.search(repo.get('description') or '')
+                        or any(_KINECT_RE.search(topic) for topic in repo.get('topics', ())))
         
-        for i, repo in enumerate(all_repos[:20]):  # Show top 20
-            print(f"\n{i+1:2d}. {repo['name']} ({repo['owner']['login']})")
-            print(f"    ⭐ Stars: {repo.get('stargazers_count', 0):,}")
-            print(f"    🍴 Forks: {repo.get('forks_count', 0):,}")
-            print(f"    💬 Language: {repo.get('language', 'Unknown')}")
-            print(f"    📅 Updated: {repo.get('updated_at', 'Unknown')[:10]}")
-            print(f"    🔗 URL: {repo.get('html_url', 'Unknown')}")
+        # Fetch the READMEs up front in parallel instead of one per printed repo
+        def fetch_readme(owner, name):
+            try:
+                return client.get_repository_readme_bytes(owner, name)
+            except GitHubAPIError as e:
+                # Don't fail the whole search if README fetch fails; the
+                # client has already retried transient errors
+                print(f"    ⚠️ README unavailable for {owner}/{name}: {e}")
+                return None
+        
+        owners_names = [(repo['owner']['login'], repo['name']) for repo in top_repos if needs_readme(repo)]
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            readmes = dict(zip(owners_names, executor.map(lambda key: fetch_readme(*key), owners_names)))
+        
+        # The report is built as a list of lines and written in one go
+        # rather than with a print() per line
+        lines = []
+        emit = lines.append
+        for i, repo in enumerate(top_repos):
+            emit(f"\n{i+1:2d}. {repo['name']} ({repo['owner']['login']})")
+            emit(f"    ⭐ Stars: {repo.get('stargazers_count', 0):,}")
+            emit(f"    🍴 Forks: {repo.get('forks_count', 0):,}")
+            emit(f"    💬 Language: {repo.get('language', 'Unknown')}")
+            emit(f"    📅 Updated: {repo.get('updated_at', 'Unknown')[:10]}")
+            emit(f"    🔗 URL: {repo.get('html_url', 'Unknown')}")
             
             description = repo.get('description', '')
             if description:
                 # Truncate long descriptions
                 if len(description) > 100:
                     description = description[:97] + "..."
-                print(f"    📝 Description: {description}")
+                emit(f"    📝 Description: {description}")
             
-            # Try to get README snippet for more context
-            try:
-                readme = client.get_repository_readme(repo['owner']['login'], repo['name'])
-                if readme and 'kinect' in readme.lower():
-                    # Find the first mention of Kinect in README
-                    readme_lower = readme.lower()
-                    kinect_pos = readme_lower.find('kinect')
-                    if kinect_pos >= 0:
-                        start_pos = max(0, kinect_pos - 80)
-                        end_pos = min(len(readme), kinect_pos + 120)
-                        snippet = readme[start_pos:end_pos].strip()
-                        # Clean up the snippet
-                        snippet = snippet.replace('\n', ' ').replace('\r', ' ')
-                        snippet = ' '.join(snippet.split())  # Remove extra whitespace
-                        if len(snippet) > 150:
-                            snippet = snippet[:147] + "..."
-                        print(f"    📖 README: ...{snippet}...")
-            except Exception as e:
-                # Don't fail the whole search if README fetch fails
-                pass
+            # README snippet for more context
+            readme = readmes.get((repo['owner']['login'], repo['name']))
+            # Find the first mention of Kinect in README
+            match = _KINECT_BYTES_RE.search(readme) if readme else None
+            if match:
+                kinect_pos = match.start()
+                start_pos = max(0, kinect_pos - 80)
+                end_pos = min(len(readme), kinect_pos + 120)
+                # The window edges may cut a multi-byte character, so drop partial sequences
+                window = readme[start_pos:end_pos].decode('utf-8', errors='ignore')
+                snippet = _WS_RE.sub(' ', window).strip()
+                if len(snippet) > 150:
+                    snippet = snippet[:147] + "..."
+                emit(f"    📖 README: ...{snippet}...")
             
-        print("\n" + "=" * 80)
-        print("🎯 Search completed! These repositories use or mention Kinect devices.")
+        emit("\n" + "=" * 80)
+        emit("🎯 Search completed! These repositories use or mention Kinect devices.")
         
         # Categorize by programming language
-        languages = {}
-        for repo in all_repos[:20]:
-            lang = repo.get('language', 'Unknown')
-            if lang not in languages:
-                languages[lang] = 0
-            languages[lang] += 1
+        languages = Counter(repo.get('language') or 'Unknown' for repo in top_repos)
+        
+        emit("\n📊 Programming Languages Distribution:")
+        for lang, count in languages.most_common():
+            emit(f"    {lang}: {count} repositories")
         
-        print("\n📊 Programming Languages Distribution:")
-        for lang, count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
-            print(f"    {lang}: {count} repositories")
+        sys.stdout.write("\n".join(lines) + "\n")
             
     except Exception as e:
         print(f"❌ Error searching Kinect repositories: {e}")
@@ -4,23 +4,105 @@ Example usage of the GitHub API Query Module
 This script demonstrates how to use the GitHubAPIClient to query GitHub repositories.
 """
 
-from query_github import GitHubAPIClient, create_github_client
-import json
+import itertools
+import os
+import sys
+
+# The client module lives with the Function App; responses are cached on disk
+# by the client itself (see GITHUB_CACHE_PATH), so repeated runs are cheap
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AzFunction'))
+
+from queryGitHub import create_github_client
+
+_CLIENT = None
+
+def _client():
+    """Return the client shared by all examples, so they reuse one session and its connections"""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = create_github_client()
+    return _CLIENT
+
+# Everything the README, issue and pull request examples show about a
+# repository, in one GraphQL round-trip. Contributors stay on REST because
+# GraphQL has no per-repository contribution counts.
+REPOSITORY_OVERVIEW_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+    issues(states: OPEN, first: 3, orderBy: {field: CREATED_AT, direction: DESC}) {
+      totalCount
+      nodes { number title createdAt author { login } labels(first: 10) { nodes { name } } }
+    }
+    pullRequests(states: OPEN, first: 3, orderBy: {field: CREATED_AT, direction: DESC}) {
+      totalCount
+      nodes { number title createdAt author { login } baseRefName headRefName }
+    }
+  }
+}
+"""
+
+def fetch_repository_overview(client, owner, repo_name):
+    """
+    Fetch the README, newest open issues and newest open pull requests in one GraphQL request.
+    
+    Issues and pull requests are reshaped like the REST API's so the examples
+    can print either. Returns None if GraphQL isn't available (it needs a
+    token), in which case the examples fall back to one REST call each.
+    """
+    try:
+        repository = client.graphql(REPOSITORY_OVERVIEW_QUERY, {'owner': owner, 'name': repo_name})['repository']
+    except Exception as e:
+        print(f"GraphQL batch unavailable, using REST: {e}\n")
+        return None
+    if repository is None:
+        return None
+    
+    def login(node):
+        return (node['author'] or {}).get('login', 'ghost')
+    
+    return {
+        'readme': (repository['readme'] or {}).get('text'),
+        'open_issues': repository['issues']['totalCount'],
+        'issues': [
+            {
+                'number': node['number'],
+                'title': node['title'],
+                'user': {'login': login(node)},
+                'created_at': node['createdAt'],
+                'labels': node['labels']['nodes']
+            }
+            for node in repository['issues']['nodes']
+        ],
+        'open_pull_requests': repository['pullRequests']['totalCount'],
+        'pull_requests': [
+            {
+                'number': node['number'],
+                'title': node['title'],
+                'user': {'login': login(node)},
+                'created_at': node['createdAt'],
+                'base': {'ref': node['baseRefName']},
+                'head': {'ref': node['headRefName']}
+            }
+            for node in repository['pullRequests']['nodes']
+        ]
+    }
 
 def example_query_organization():
     """Example: Query repositories for an organization"""
-    client = create_github_client()
+    client = _client()
     
     # Replace 'microsoft' with any organization name you want to query
     org_name = "dngoins"
     print(f"Fetching repositories for organization: {org_name}")
     
     try:
-        repos = client.get_organization_repositories(org_name)
-        print(f"Found {len(repos)} repositories\n")
+        # Only the first 3 are shown, so fetch a single page of 3
+        repos = list(itertools.islice(client.iter_repositories(org_name, per_page=3), 3))
+        print(f"Showing {len(repos)} most recently updated repositories\n")
         
         # Display first 3 repositories with key information
-        for i, repo in enumerate(repos[:3]):
+        for i, repo in enumerate(repos):
             print(f"{i+1}. {repo['name']}")
             print(f"   Description: {repo.get('description', 'No description')}")
             print(f"   Language: {repo.get('language', 'Unknown')}")
@@ -32,9 +114,9 @@ def example_query_organization():
     except Exception as e:
         print(f"Error fetching repositories: {e}")
 
-def example_query_readme():
-    """Example: Get README for a specific repository"""
-    client = create_github_client()
+def example_query_readme(overview=None):
+    """Example: Get README for a specific repository (from a prefetched overview if given)"""
+    client = _client()
     
     owner = "microsoft"
     repo_name = "vscode"
@@ -42,7 +124,10 @@ def example_query_readme():
     print(f"Fetching README for {owner}/{repo_name}")
     
     try:
-        readme = client.get_repository_readme(owner, repo_name)
+        if overview is not None:
+            readme = overview['readme']
+        else:
+            readme = client.get_repository_readme(owner, repo_name)
         if readme:
             print(f"README length: {len(readme)} characters")
             print("First 300 characters:")
@@ -53,9 +138,9 @@ def example_query_readme():
     except Exception as e:
         print(f"Error fetching README: {e}")
 
-def example_query_issues():
-    """Example: Get issues for a repository"""
-    client = create_github_client()
+def example_query_issues(overview=None):
+    """Example: Get issues for a repository (from a prefetched overview if given)"""
+    client = _client()
     
     owner = "microsoft"
     repo_name = "vscode"
@@ -63,11 +148,18 @@ def example_query_issues():
     print(f"Fetching open issues for {owner}/{repo_name}")
     
     try:
-        issues = client.get_repository_issues(owner, repo_name, state="open")
-        print(f"Found {len(issues)} open issues\n")
+        if overview is not None:
+            issues, total = overview['issues'], overview['open_issues']
+        else:
+            issues = list(itertools.islice(client.iter_repository_issues(owner, repo_name, state="open", per_page=3), 3))
+            total = None
+        if total is not None:
+            print(f"Found {total} open issues\n")
+        else:
+            print(f"Showing {len(issues)} open issues\n")
         
         # Display first 3 issues
-        for i, issue in enumerate(issues[:3]):
+        for i, issue in enumerate(issues):
             print(f"{i+1}. #{issue['number']}: {issue['title']}")
             print(f"   Author: {issue['user']['login']}")
             print(f"   Created: {issue['created_at']}")
@@ -77,9 +169,9 @@ def example_query_issues():
     except Exception as e:
         print(f"Error fetching issues: {e}")
 
-def example_query_pull_requests():
-    """Example: Get pull requests for a repository"""
-    client = create_github_client()
+def example_query_pull_requests(overview=None):
+    """Example: Get pull requests for a repository (from a prefetched overview if given)"""
+    client = _client()
     
     owner = "microsoft"
     repo_name = "vscode"
@@ -87,11 +179,18 @@ def example_query_pull_requests():
     print(f"Fetching open pull requests for {owner}/{repo_name}")
     
     try:
-        prs = client.get_repository_pull_requests(owner, repo_name, state="open")
-        print(f"Found {len(prs)} open pull requests\n")
+        if overview is not None:
+            prs, total = overview['pull_requests'], overview['open_pull_requests']
+        else:
+            prs = list(itertools.islice(client.iter_repository_pull_requests(owner, repo_name, state="open", per_page=3), 3))
+            total = None
+        if total is not None:
+            print(f"Found {total} open pull requests\n")
+        else:
+            print(f"Showing {len(prs)} open pull requests\n")
         
         # Display first 3 PRs
-        for i, pr in enumerate(prs[:3]):
+        for i, pr in enumerate(prs):
             print(f"{i+1}. #{pr['number']}: {pr['title']}")
             print(f"   Author: {pr['user']['login']}")
             print(f"   Created: {pr['created_at']}")
@@ -103,7 +202,7 @@ def example_query_pull_requests():
 
 def example_query_contributors():
     """Example: Get contributors for a repository"""
-    client = create_github_client()
+    client = _client()
     
     owner = "microsoft"
     repo_name = "vscode"
@@ -111,11 +210,11 @@ def example_query_contributors():
     print(f"Fetching contributors for {owner}/{repo_name}")
     
     try:
-        contributors = client.get_repository_contributors(owner, repo_name)
-        print(f"Found {len(contributors)} contributors\n")
+        contributors = list(itertools.islice(client.iter_repository_contributors(owner, repo_name, per_page=5), 5))
+        print(f"Showing top {len(contributors)} contributors\n")
         
         # Display top 5 contributors
-        for i, contributor in enumerate(contributors[:5]):
+        for i, contributor in enumerate(contributors):
             print(f"{i+1}. {contributor['login']}")
             print(f"   Contributions: {contributor['contributions']}")
             print(f"   Profile: {contributor['html_url']}")
@@ -128,11 +227,15 @@ if __name__ == "__main__":
     print("GitHub API Query Examples")
     print("=" * 40)
     
+    # The README, issue and pull request examples all target microsoft/vscode,
+    # so fetch what they show in a single GraphQL request
+    overview = fetch_repository_overview(_client(), "microsoft", "vscode")
+    
     # Run all examples
     example_query_organization()
-    example_query_readme()
-    example_query_issues()
-    example_query_pull_requests()
+    example_query_readme(overview)
+    example_query_issues(overview)
+    example_query_pull_requests(overview)
     example_query_contributors()
     
     print("Examples completed!")